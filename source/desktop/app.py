@@ -21,6 +21,9 @@ def main():
     window = FireballAnalysisApp()
     window.show()
     
+    # 窗口显示后再在后台加载模型，避免阻塞事件循环启动
+    window.load_models()
+    
     sys.exit(app.exec())
 
 
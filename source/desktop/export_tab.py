@@ -4,19 +4,41 @@
 导出模块标签页
 """
 
+from collections import deque
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                               QTextEdit, QPushButton, QComboBox, QCheckBox, QGroupBox)
-from PySide6.QtCore import QTimer
+                               QPlainTextEdit, QPushButton, QComboBox, QCheckBox, QGroupBox,
+                               QSizePolicy, QSpacerItem)
+from PySide6.QtCore import Qt, QTimer, QMetaObject
+
+
+def _stretch():
+    """竖直方向的弹性空白（布局接管所有权，每次构建新建一个）"""
+    return QSpacerItem(0, 0, QSizePolicy.Minimum, QSizePolicy.Expanding)
 
 
 class ExportTab(QWidget):
     """导出模块标签页"""
     
+    MAX_LINE = 2000    # 单行最大字符数，超出部分截断
+    MAX_BLOCKS = 5000  # 日志最大保留行数
+    FLUSH_INTERVAL_MS = 33  # 日志刷新间隔（约30Hz）
+    EXPORT_FORMATS = ("CSV", "JSON", "Excel (xlsx)")
+    
     def __init__(self, parent=None):
         super().__init__(parent)
+        # 待写入的日志队列，由单次定时器批量刷新到界面（队列为空时定时器不运行）
+        self._pending = deque()
+        self._flush_armed = False  # 已请求启动刷新定时器，尚未刷新
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush_log)
+        
         self.init_ui()
         
     def init_ui(self):
+        # 构建期间暂停重绘，所有子控件添加完后统一布局一次
+        self.setUpdatesEnabled(False)
         layout = QVBoxLayout()
         
         # 工具栏
@@ -24,30 +46,61 @@ class ExportTab(QWidget):
         toolbar.addWidget(QLabel("导出预览与日志"))
         layout.addLayout(toolbar)
         
-        # 日志显示区域
-        self.log_text = QTextEdit()
-        self.log_text.setStyleSheet("""
-            QTextEdit {
-                background-color: #0b1220;
-                color: #cbd5e1;
-                border: 1px solid #1f2937;
-                border-radius: 10px;
-                font-family: 'Courier New', monospace;
-                font-size: 12px;
-            }
-        """)
-        self.log_text.setPlainText("[日志] 准备导出…")
-        layout.addWidget(self.log_text)
+        # 日志显示区域：首次写入前只用轻量的 QLabel 占位，不创建文本文档
+        self.log_text = None
+        self.log_label = QLabel("[日志] 准备导出…")
+        self.log_label.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        self.log_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.log_label.setProperty("class", "log")
+        layout.addWidget(self.log_label)
         
         self.setLayout(layout)
+        self.setUpdatesEnabled(True)
+        
+    def _ensure_log_text(self):
+        """首次写日志时将占位标签替换为 QPlainTextEdit"""
+        if self.log_text is not None:
+            return
+        self.log_text = QPlainTextEdit()
+        self.log_text.setReadOnly(True)
+        self.log_text.setMaximumBlockCount(self.MAX_BLOCKS)  # 限制回滚行数
+        self.log_text.setProperty("class", "log")
+        self.log_text.appendPlainText(self.log_label.text())
+        self.layout().replaceWidget(self.log_label, self.log_text)
+        self.log_label.deleteLater()
+        self.log_label = None
+    
+    def log(self, msg):
+        """追加日志（可在任意线程调用；仅入队，约 33ms 后由 GUI 线程合并写入）"""
+        self._pending.append(msg)
+        if not self._flush_armed:
+            self._flush_armed = True
+            # 定时器只能在所属线程启动，排队到 GUI 线程执行
+            QMetaObject.invokeMethod(self._flush_timer, "start", Qt.QueuedConnection)
+    
+    def _flush_log(self):
+        """将队列中的日志合并为一次写入（超长行截断，避免文本布局卡顿）"""
+        # 先清除标记再取队列，刷新期间新入队的日志会重新请求刷新
+        self._flush_armed = False
+        if not self._pending:
+            return
+        
+        lines = []
+        while self._pending:
+            for line in self._pending.popleft().splitlines():
+                if len(line) > self.MAX_LINE:
+                    line = line[:self.MAX_LINE] + "…[truncated]"
+                lines.append(line)
+        
+        if lines:
+            self._ensure_log_text()
+            self.log_text.appendPlainText("\n".join(lines))
     
     def get_sidebar_widget(self):
         """获取导出模块的侧边栏组件"""
         if not hasattr(self, '_sidebar_widget'):
-            from PySide6.QtWidgets import QGroupBox, QComboBox, QCheckBox
-            from PySide6.QtCore import Qt
-            
             self._sidebar_widget = QGroupBox("结果导出")
+            self._sidebar_widget.setUpdatesEnabled(False)
             layout = QVBoxLayout()
             layout.setAlignment(Qt.AlignTop)  # 只向上对齐
             
@@ -63,18 +116,18 @@ class ExportTab(QWidget):
             
             layout.addWidget(QLabel("导出格式"))
             self.exp_format = QComboBox()
-            self.exp_format.addItems(["CSV", "JSON", "Excel (xlsx)"])
+            self.exp_format.addItems(self.EXPORT_FORMATS)
             layout.addWidget(self.exp_format)
             
             self.export_btn = QPushButton("导出")
-            self.export_btn.setStyleSheet("QPushButton { background-color: #0ea5e9; color: white; }")
+            self.export_btn.setProperty("class", "primary")
             layout.addWidget(self.export_btn)
             
-            layout.addStretch()
+            layout.addSpacerItem(_stretch())
             self.export_status = QLabel("等待导出")
-            self.export_status.setStyleSheet("color: #9ca3af; font-size: 12px;")
             layout.addWidget(self.export_status)
             
             self._sidebar_widget.setLayout(layout)
+            self._sidebar_widget.setUpdatesEnabled(True)
         
         return self._sidebar_widget
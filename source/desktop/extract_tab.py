@@ -4,25 +4,239 @@
 特征提取模块标签页
 """
 
-import numpy as np
 import json
 import os
-import glob
-import sys
+import re
+import logging
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                                QPushButton, QSplitter, QSlider, QComboBox, QLineEdit, QGroupBox,
-                               QFileDialog, QMessageBox)
-from PySide6.QtCore import Qt
+                               QFileDialog, QMessageBox, QSizePolicy, QSpacerItem)
+from PySide6.QtCore import Qt, QTimer, QObject, Signal, QRunnable, QThreadPool, QThread
+from PySide6.QtGui import QIntValidator, QPixmap, QImage, QPixmapCache
 from framework import MatplotlibWidget, ImagePreviewWidget
 
-# 添加路径以导入火球计算器
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-from fireball_radius_calculator import FireballCalculator
+logger = logging.getLogger(__name__)
+
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB
+    _turbo_jpeg = TurboJPEG()
+except (ImportError, RuntimeError, OSError):
+    # 未安装 PyTurboJPEG 或找不到 libjpeg-turbo 时使用 Qt 自带的解码器
+    _turbo_jpeg = None
+
+# 温度CSV容错解析：每行前两列为数字时取出（其余列忽略）；只用 [ \t] 匹配空白，匹配不会跨行
+_NUM = r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?"
+_CSV_ROW_RE = re.compile(rf"^[ \t]*({_NUM})[ \t]*,[ \t]*({_NUM})(?=[ \t]*(?:,|\r?$))", re.MULTILINE)
+
+
+def _hstretch():
+    """水平方向的弹性空白（布局接管所有权，每次构建新建一个）"""
+    return QSpacerItem(0, 0, QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+
+def _decimate(x, y, target=1200):
+    """最小/最大值降采样：每个区间保留 y 的最小、最大值点（按原顺序），点数不超过 target"""
+    n = len(x)
+    if n <= target:
+        return x, y
+    edges = np.linspace(0, n, target // 2 + 1).astype(int)
+    starts, ends = edges[:-1], edges[1:] - 1
+    widths = np.diff(edges)
+    # 各区间最值首次出现的位置（NaN 使比较全部不成立时，截到区间末尾）
+    i_min = _first_match(y == np.repeat(np.minimum.reduceat(y, starts), widths), starts, ends)
+    i_max = _first_match(y == np.repeat(np.maximum.reduceat(y, starts), widths), starts, ends)
+    # 两点按在区间内的先后顺序输出，不改变曲线形状
+    idx = np.column_stack((np.minimum(i_min, i_max), np.maximum(i_min, i_max))).ravel()
+    return x[idx], y[idx]
+
+
+def _first_match(mask, starts, ends):
+    """每个区间 [starts, ends] 内 mask 第一个为真的下标"""
+    hits = np.flatnonzero(mask)
+    pos = np.searchsorted(hits, starts)
+    first = hits[np.minimum(pos, len(hits) - 1)] if len(hits) else ends
+    return np.clip(first, starts, ends)
+
+
+class FrameDecoder(QRunnable):
+    """后台线程中解码一帧图像，缩小到预览尺寸后写入预分配的帧数组
+    
+    只使用线程安全的 QImage；缩放后尺寸与帧数组不一致的图像不写入，显示时回退到按文件解码。
+    JPEG 在可用时用 libjpeg-turbo（SIMD）解码。
+    """
+    
+    def __init__(self, image_path, index, frame_cube, frame_ready):
+        super().__init__()
+        self.image_path = image_path
+        self.index = index
+        self.frame_cube = frame_cube
+        self.frame_ready = frame_ready
+        
+    def run(self):
+        image = self._decode()
+        if image is None or image.isNull():
+            return
+        _, height, width, _ = self.frame_cube.shape
+        if image.width() != width or image.height() != height:
+            image = image.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        image = image.convertToFormat(QImage.Format_RGB888)
+        if image.width() != width or image.height() != height:
+            return
+        # 每行可能有对齐填充，按 bytesPerLine 取出有效像素
+        rows = np.frombuffer(image.constBits(), np.uint8).reshape(height, image.bytesPerLine())
+        self.frame_cube[self.index] = rows[:, :width * 3].reshape(height, width, 3)
+        self.frame_ready[self.index] = True
+        
+    def _decode(self):
+        if _turbo_jpeg is not None and self.image_path.lower().endswith(('.jpg', '.jpeg')):
+            try:
+                with open(self.image_path, 'rb') as f:
+                    self._buffer = _turbo_jpeg.decode(f.read(), pixel_format=TJPF_RGB)
+                height, width, _ = self._buffer.shape
+                # QImage 直接引用解码缓冲区，_buffer 保持其存活
+                return QImage(self._buffer.data, width, height, self._buffer.strides[0],
+                              QImage.Format_RGB888)
+            except (OSError, ValueError):
+                # 工作线程中每帧都可能失败，只记调试日志，不刷屏
+                logger.debug("turbojpeg 解码失败，改用 Qt 解码: %s", self.image_path, exc_info=True)
+        return QImage(self.image_path)
+
+
+@dataclass
+class SequenceConfig:
+    """火球爆炸序列 JSON 中用到的字段（加载时解析一次）"""
+    image_folder: str = ''
+    temperature_file: str = ''
+    explosion_duration: int = 140  # 毫秒
+    material_type: str = '40%Al/Rubber'
+    
+    @classmethod
+    def from_json(cls, data):
+        files = data.get('files', {})
+        parameters = data.get('parameters', {})
+        return cls(image_folder=files.get('image_folder', ''),
+                   temperature_file=files.get('temperature_file', ''),
+                   explosion_duration=int(parameters.get('explosion_duration', 140)),
+                   material_type=parameters.get('material_type', '40%Al/Rubber'))
+
+
+class SequenceLoaderSignals(QObject):
+    """序列加载信号（QRunnable 不是 QObject，信号需单独定义）"""
+    finished = Signal(dict)
+
+
+class SequenceLoader(QRunnable):
+    """后台线程中读取序列 JSON、扫描图像目录、读取温度 CSV 并解码首帧
+    
+    只做文件 IO，不访问界面；图像与温度数据互不依赖，并行读取。
+    结果通过 finished 信号回到 GUI 线程。
+    """
+    
+    IMAGE_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg', '.bmp', '.tiff'})
+    
+    def __init__(self, file_path, read_temperature_csv):
+        super().__init__()
+        self.file_path = file_path
+        self.read_temperature_csv = read_temperature_csv
+        self.signals = SequenceLoaderSignals()
+        
+    def run(self):
+        result = {'sequence_data': None, 'config': None, 'image_files': None,
+                  'first_image': None, 'time_data': None, 'temp_data': None, 'error': None}
+        try:
+            with open(self.file_path, 'r', encoding='utf-8') as f:
+                sequence_data = json.load(f)
+            config = SequenceConfig.from_json(sequence_data)
+            result['sequence_data'] = sequence_data
+            result['config'] = config
+            
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                images = executor.submit(self._scan_images, config.image_folder)
+                temperature = executor.submit(self._read_temperature, config.temperature_file)
+                result['image_files'], result['first_image'] = images.result()
+                result['time_data'], result['temp_data'] = temperature.result()
+        except Exception as e:
+            result['error'] = str(e)
+        
+        self.signals.finished.emit(result)
+        
+    def _scan_images(self, folder_path):
+        """扫描图像文件并解码首帧；文件夹不存在时返回 (None, None)"""
+        if not folder_path or folder_path == "未设置" or not os.path.exists(folder_path):
+            return None, None
+        # 检查文件夹中的图像文件（一次遍历目录，扩展名不区分大小写）
+        image_files = sorted(
+            entry.path for entry in os.scandir(folder_path)
+            if entry.is_file()
+            and os.path.splitext(entry.name)[1].lower() in self.IMAGE_EXTENSIONS)
+        first_image = QImage(image_files[0]) if image_files else None
+        return image_files, first_image
+        
+    def _read_temperature(self, temp_file_path):
+        """读取温度 CSV；文件不存在时返回 (None, None)"""
+        if temp_file_path and temp_file_path != "未设置" and os.path.exists(temp_file_path):
+            return self.read_temperature_csv(temp_file_path)
+        print(f"❌ 温度文件不存在或未设置: {temp_file_path}")
+        return None, None
+
+
+class ExtractionSignals(QObject):
+    """特征提取信号（QRunnable 不是 QObject，信号需单独定义）"""
+    finished = Signal(dict)
+
+
+class ExtractionWorker(QRunnable):
+    """后台线程中计算火球直径随时间变化的曲线
+    
+    只做数值计算，不访问界面；结果通过 finished 信号回到 GUI 线程。
+    """
+    
+    TIME_POINTS = 100  # 时间点数量
+    
+    def __init__(self, calculator, material_name, explosion_duration):
+        super().__init__()
+        self.calculator = calculator
+        self.material_name = material_name
+        self.explosion_duration = explosion_duration
+        self.signals = ExtractionSignals()
+        
+    def run(self):
+        result = {'time_ms': None, 'diameter_m': None, 'material': self.material_name,
+                  'explosion_duration': self.explosion_duration, 'error': None}
+        try:
+            # 生成时间序列 (0-140ms)
+            t_ms = np.linspace(0, self.explosion_duration, self.TIME_POINTS)  # 毫秒
+            t_s = t_ms / 1000.0  # 转换为秒
+            result['time_ms'] = t_ms
+            # calculate_diameter 支持数组，整条曲线一次算出
+            result['diameter_m'] = self.calculator.calculate_diameter(
+                t_s, self.material_name).tolist()
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+            result['error'] = str(e)
+        self.signals.finished.emit(result)
 
 
 class ExtractTab(QWidget):
     """特征提取模块标签页"""
     
+    PIXMAP_CACHE_LIMIT_KB = 256 * 1024  # 全局 QPixmapCache 容量下限（KB）
+    
+    EXTRACT_MODELS = ("U-Net 分割", "DeepLabV3", "SAM")
+    SEQUENCE_FILTER = "JSON文件 (*.json);;所有文件 (*)"  # 序列文件对话框过滤器
+    # 序列文件中的材料类型 -> 计算器中的材料名称
+    MATERIAL_NAMES = {
+        '40% Al / Rubber': '40%Al/Rubber',
+        '30% Al / Rubber': '30%Al/Rubber',
+        '50% Al / Rubber': '50%Al/Rubber',
+        '60% Al / Rubber': '60%Al/Rubber',
+        'Polyurethane': 'Polyurethane'
+    }
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         # 初始化图像序列相关属性
@@ -30,51 +244,59 @@ class ExtractTab(QWidget):
         self.current_image_index = 0  # 当前显示的图像索引
         self.sequence_folder_path = None  # 序列文件夹路径
         self.sequence_data = None  # 序列数据
+        self.sequence_config = None  # 解析后的序列配置（SequenceConfig）
         self.explosion_duration = 140  # 爆炸时长（毫秒）
+        self._time_ms_table = None  # 各帧对应的实际时间（毫秒）
+        self._time_labels = []  # 各帧的时间标签（加载序列时预先生成）
+        self._batch_cache = 8  # 最近一次有效的批处理大小
+        # 已解码帧放入 Qt 的全局 QPixmapCache（LRU），按需扩大容量
+        if QPixmapCache.cacheLimit() < self.PIXMAP_CACHE_LIMIT_KB:
+            QPixmapCache.setCacheLimit(self.PIXMAP_CACHE_LIMIT_KB)
+        self.frame_cube = None  # 后台预解码的整段序列（预览尺寸）(N, H, W, 3) uint8
+        self._frame_ready = None  # 各帧是否已写入 frame_cube
+        # 帧解码使用独立线程池，留出一个核心，不阻塞全局线程池中的提取、预测和保存任务
+        self._decode_pool = QThreadPool(self)
+        self._decode_pool.setMaxThreadCount(max(1, QThread.idealThreadCount() - 1))
+        
+        # 火球计算器由后台线程加载，就绪前禁用提取按钮
+        self.fireball_calculator = None
+        # 已算出的直径曲线：(材料, 爆炸时长) -> 计算结果
+        self._diameter_curves = {}
         
-        # 初始化火球计算器
-        self.fireball_calculator = FireballCalculator()
+        # 图表在标签页首次显示时才初始化
+        self._charts_ready = False
         
         self.init_ui()
         self.setup_connections()
+        
+    def showEvent(self, event):
+        super().showEvent(event)
         self.init_charts()
         
     def init_ui(self):
+        # 构建期间暂停重绘，所有子控件添加完后统一布局一次
+        self.setUpdatesEnabled(False)
+        # 多次使用的枚举绑定为局部变量
+        AlignTop = Qt.AlignTop
+        Horizontal = Qt.Horizontal
         layout = QHBoxLayout()
         
         # 左侧图像预览
         left_widget = QWidget()
         left_layout = QVBoxLayout()
-        left_layout.setAlignment(Qt.AlignTop)  # 只向上对齐
+        left_layout.setAlignment(AlignTop)  # 只向上对齐
         
         toolbar = QHBoxLayout()
         toolbar.addWidget(QLabel("提取结果预览与质量检查"))
         toolbar.addStretch()
         self.progress_label = QLabel("0%")
-        self.progress_label.setStyleSheet("color: #9ca3af; font-size: 12px;")
         toolbar.addWidget(self.progress_label)
         left_layout.addLayout(toolbar)
         
         # 图像预览和时间轴组合
         preview_group = QGroupBox("火球爆炸序列预览")
-        preview_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 1px solid #1f2937;
-                border-radius: 10px;
-                margin-top: 10px;
-                padding-top: 10px;
-                background-color: #111827;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #38bdf8;
-            }
-        """)
         preview_group_layout = QVBoxLayout()
-        preview_group_layout.setAlignment(Qt.AlignTop)  # 只向上对齐
+        preview_group_layout.setAlignment(AlignTop)  # 只向上对齐
         preview_group_layout.setSpacing(8)
         
         self.extract_preview = ImagePreviewWidget()
@@ -82,11 +304,10 @@ class ExtractTab(QWidget):
         
         # 时间轴
         timeline_layout = QHBoxLayout()
-        timeline_layout.setAlignment(Qt.AlignTop)  # 只向上对齐
-        self.extract_slider = QSlider(Qt.Horizontal)
+        timeline_layout.setAlignment(AlignTop)  # 只向上对齐
+        self.extract_slider = QSlider(Horizontal)
         self.extract_slider.setRange(0, 100)
         self.extract_time_label = QLabel("t = 0 ms")
-        self.extract_time_label.setStyleSheet("color: #9ca3af; font-size: 12px;")
         timeline_layout.addWidget(self.extract_slider)
         timeline_layout.addWidget(self.extract_time_label)
         preview_group_layout.addLayout(timeline_layout)
@@ -99,29 +320,13 @@ class ExtractTab(QWidget):
         # 右侧图表区域
         right_widget = QWidget()
         right_layout = QVBoxLayout()
-        right_layout.setAlignment(Qt.AlignTop)  # 只向上对齐
+        right_layout.setAlignment(AlignTop)  # 只向上对齐
         right_layout.setSpacing(10)
         
         # 温度图表
         temp_group = QGroupBox("火球温度随时间变化")
-        temp_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 1px solid #1f2937;
-                border-radius: 10px;
-                margin-top: 10px;
-                padding-top: 10px;
-                background-color: #111827;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #38bdf8;
-            }
-        """)
         temp_layout = QVBoxLayout()
-        temp_layout.setAlignment(Qt.AlignTop)
+        temp_layout.setAlignment(AlignTop)
         
         self.temp_chart = MatplotlibWidget(width=4, height=2.5)
         temp_layout.addWidget(self.temp_chart)
@@ -130,24 +335,8 @@ class ExtractTab(QWidget):
         
         # 直径图表
         diam_group = QGroupBox("火球直径随时间变化")
-        diam_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 1px solid #1f2937;
-                border-radius: 10px;
-                margin-top: 10px;
-                padding-top: 10px;
-                background-color: #111827;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #38bdf8;
-            }
-        """)
         diam_layout = QVBoxLayout()
-        diam_layout.setAlignment(Qt.AlignTop)
+        diam_layout.setAlignment(AlignTop)
         
         self.diam_chart = MatplotlibWidget(width=4, height=2.5)
         diam_layout.addWidget(self.diam_chart)
@@ -156,7 +345,7 @@ class ExtractTab(QWidget):
         
         # 控制按钮
         button_layout = QHBoxLayout()
-        button_layout.setAlignment(Qt.AlignTop)
+        button_layout.setAlignment(AlignTop)
         self.save_button = QPushButton("保存提取序列")
         self.save_button.setEnabled(False)
         button_layout.addWidget(self.save_button)
@@ -167,17 +356,29 @@ class ExtractTab(QWidget):
         right_widget.setLayout(right_layout)
         
         # 添加到主布局
-        splitter = QSplitter(Qt.Horizontal)
+        splitter = QSplitter(Horizontal)
         splitter.addWidget(left_widget)
         splitter.addWidget(right_widget)
-        splitter.setSizes([600, 300])
+        splitter.setStretchFactor(0, 2)
+        splitter.setStretchFactor(1, 1)
+        splitter.setCollapsible(0, False)
+        splitter.setCollapsible(1, False)
         
         layout.addWidget(splitter)
         self.setLayout(layout)
+        self.setUpdatesEnabled(True)
     
     def setup_connections(self):
         """设置信号连接"""
-        self.extract_slider.valueChanged.connect(self.on_time_changed)
+        # 时间轴刷新定时器：键盘/滚轮改变时限频（约30Hz），拖动时用作停顿检测
+        self._slider_timer = QTimer(self)
+        self._slider_timer.setSingleShot(True)
+        self._slider_timer.setInterval(33)
+        self._slider_timer.timeout.connect(self._redraw_preview)
+        self.extract_slider.valueChanged.connect(self.on_slider_value_changed)
+        # 拖动时只更新时间标签，停顿或松开后才解码图像
+        self.extract_slider.sliderMoved.connect(self.on_slider_moved)
+        self.extract_slider.sliderReleased.connect(self.on_slider_released)
         
         # 连接特征提取按钮
         if hasattr(self, 'extract_btn'):
@@ -186,9 +387,8 @@ class ExtractTab(QWidget):
     def get_sidebar_widget(self):
         """获取特征提取模块的侧边栏组件"""
         if not hasattr(self, '_sidebar_widget'):
-            from PySide6.QtWidgets import QGroupBox, QComboBox, QLineEdit
-            
             self._sidebar_widget = QGroupBox("特征提取")
+            self._sidebar_widget.setUpdatesEnabled(False)
             layout = QVBoxLayout()
             layout.setAlignment(Qt.AlignTop)  # 只向上对齐
             
@@ -198,22 +398,24 @@ class ExtractTab(QWidget):
             
             layout.addWidget(QLabel("模型选择"))
             self.extract_model = QComboBox()
-            self.extract_model.addItems(["U-Net 分割", "DeepLabV3", "SAM"])
+            self.extract_model.addItems(self.EXTRACT_MODELS)
             layout.addWidget(self.extract_model)
             
             layout.addWidget(QLabel("批处理大小"))
-            self.batch_size = QLineEdit("8")
+            self.batch_size = QLineEdit(str(self._batch_cache))
+            self.batch_size.setValidator(QIntValidator(1, 512, self))
+            self.batch_size.textChanged.connect(self.on_batch_size_changed)
             layout.addWidget(self.batch_size)
             
             button_layout = QHBoxLayout()
             self.extract_btn = QPushButton("开始特征提取")
-            self.extract_btn.setStyleSheet("QPushButton { background-color: #0ea5e9; color: white; }")
+            self.extract_btn.setProperty("class", "primary")
+            self.extract_btn.setEnabled(self.fireball_calculator is not None)
             self.cancel_extract_btn = QPushButton("取消")
             button_layout.addWidget(self.extract_btn)
             button_layout.addWidget(self.cancel_extract_btn)
-            button_layout.addStretch()
+            button_layout.addSpacerItem(_hstretch())
             self.extract_status = QLabel("待开始")
-            self.extract_status.setStyleSheet("color: #9ca3af; font-size: 12px;")
             button_layout.addWidget(self.extract_status)
             layout.addLayout(button_layout)
             
@@ -222,22 +424,58 @@ class ExtractTab(QWidget):
             # 设置信号连接
             self.sequence_btn.clicked.connect(self.select_sequence_folder)
             self.extract_btn.clicked.connect(self.start_feature_extraction)
+            self._sidebar_widget.setUpdatesEnabled(True)
         
         return self._sidebar_widget
     
+    @property
+    def batch_size_int(self):
+        """批处理大小（整数，输入变化时已解析缓存）"""
+        return self._batch_cache
+    
+    def on_batch_size_changed(self, text):
+        """批处理大小变化，仅在输入合法时更新缓存"""
+        if self.batch_size.hasAcceptableInput():
+            self._batch_cache = int(text)
+    
+    def on_models_ready(self, calculator):
+        """模型加载完成"""
+        self.fireball_calculator = calculator
+        if hasattr(self, 'extract_btn'):
+            self.extract_btn.setEnabled(True)
+    
+    def on_slider_value_changed(self, value):
+        """时间轴数值变化（键盘、滚轮或程序设置），合并到下一次定时刷新"""
+        if self.extract_slider.isSliderDown():
+            return  # 拖动中由 on_slider_moved 处理
+        if not self._slider_timer.isActive():
+            self._slider_timer.start()
+    
+    def on_slider_moved(self, value):
+        """拖动时间轴：立即更新时间标签，每次移动重新计时，停顿后再显示图像"""
+        self._update_time_label(value)
+        self._slider_timer.start()
+    
+    def on_slider_released(self):
+        """松开时间轴后立即显示当前帧"""
+        self._slider_timer.stop()
+        self._redraw_preview()
+    
+    def _redraw_preview(self):
+        """按时间轴当前值刷新预览"""
+        self.on_time_changed(self.extract_slider.value())
+    
     def on_time_changed(self, value):
         """时间轴变化"""
+        self._update_time_label(value)
         if self.image_files:
-            # 计算实际时间（毫秒）
-            total_frames = len(self.image_files)
-            if total_frames > 1:
-                time_ms = (value / (total_frames - 1)) * self.explosion_duration
-            else:
-                time_ms = 0
-            self.extract_time_label.setText(f"t = {time_ms:.1f} ms (帧 {value + 1}/{total_frames})")
-            
             # 显示对应的图像
             self.display_image_at_index(value)
+    
+    def _update_time_label(self, value):
+        """按预先生成的标签显示当前时间"""
+        if self.image_files:
+            self.extract_time_label.setText(self._time_labels[value])
         else:
             self.extract_time_label.setText(f"t = {value} ms")
     
@@ -248,83 +486,135 @@ class ExtractTab(QWidget):
         
         try:
             image_path = self.image_files[index]
-            # 使用 ImagePreviewWidget 的 set_image 方法
-            self.extract_preview.set_image(image_path)
+            self.extract_preview.set_pixmap(self._get_pixmap(index))
             self.current_image_index = index
-            print(f"显示图像: {image_path} (索引: {index})")
+            # 空闲时把已解码的相邻帧放入缓存，来回拖动时间轴可直接命中
+            QTimer.singleShot(0, lambda: self._preload_neighbors(index))
+            # 拖动时间轴时每帧都会调用，调试信息默认关闭
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"显示图像: {image_path} (索引: {index})")
                 
         except Exception as e:
             print(f"显示图像失败: {e}")
     
+    @staticmethod
+    def _cache_key(image_path):
+        """QPixmapCache 为全局共享，键加前缀避免与其他模块冲突"""
+        return "extract:" + image_path
+    
+    def _get_pixmap(self, index):
+        """从 QPixmapCache 取已解码的帧，未命中时解码后放入缓存"""
+        image_path = self.image_files[index]
+        key = self._cache_key(image_path)
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None:
+            return pixmap
+        
+        if self._frame_ready is not None and self._frame_ready[index]:
+            # 后台已解码，直接从帧数组构建，无需读盘
+            frame = self.frame_cube[index]
+            height, width, _ = frame.shape
+            image = QImage(frame.data, width, height, width * 3, QImage.Format_RGB888)
+            pixmap = QPixmap.fromImage(image)
+        else:
+            pixmap = QPixmap(image_path)
+        QPixmapCache.insert(key, pixmap)
+        return pixmap
+    
+    def _preload_neighbors(self, index):
+        """把后台已解码的前后相邻帧放入缓存（尚未解码完成的帧不在 GUI 线程读盘解码）"""
+        frame_ready = self._frame_ready
+        if frame_ready is None:
+            return
+        for i in (index + 1, index - 1):
+            if 0 <= i < len(self.image_files) and frame_ready[i]:
+                self._get_pixmap(i)
+    
     def select_sequence_folder(self):
-        """选择火球爆炸序列JSON文件"""
+        """选择火球爆炸序列JSON文件，文件读取在后台线程完成"""
         # 选择JSON文件
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "选择火球爆炸序列文件",
-            "", "JSON文件 (*.json);;所有文件 (*)"
+            self, "选择火球爆炸序列文件", "", self.SEQUENCE_FILTER,
+            options=QFileDialog.ReadOnly
         )
         
         if file_path:
-            try:
-                # 读取JSON文件
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    self.sequence_data = json.load(f)
-                
-                # 解析图像序列路径
-                image_folder_path = self.sequence_data.get('files', {}).get('image_folder', '')
-                if not image_folder_path or image_folder_path == "未设置":
-                    QMessageBox.warning(self, "警告", "JSON文件中没有有效的图像序列路径！")
-                    self.extract_status.setText("无效的图像序列路径")
-                    return
-                
-                # 获取爆炸时长
-                self.explosion_duration = int(self.sequence_data.get('parameters', {}).get('explosion_duration', 140))
-                
-                # 加载图像序列
-                success = self.load_image_sequence(image_folder_path)
+            self.sequence_btn.setEnabled(False)
+            self.extract_status.setText("正在加载序列…")
+            self._sequence_loader = SequenceLoader(file_path, self._read_temperature_csv)
+            self._sequence_loader.signals.finished.connect(self._on_sequence_loaded)
+            QThreadPool.globalInstance().start(self._sequence_loader)
+    
+    def _on_sequence_loaded(self, result):
+        """后台加载完成，在 GUI 线程中更新界面"""
+        self.sequence_btn.setEnabled(True)
+        if result['error'] is not None:
+            QMessageBox.critical(self, "错误", f"读取序列文件失败:\n{result['error']}")
+            self.extract_status.setText("读取文件失败")
+            print(f"读取序列文件失败: {result['error']}")
+            return
+        
+        try:
+            self.sequence_data = result['sequence_data']
+            self.sequence_config = config = result['config']
+            
+            # 解析图像序列路径
+            image_folder_path = config.image_folder
+            if not image_folder_path or image_folder_path == "未设置":
+                QMessageBox.warning(self, "警告", "JSON文件中没有有效的图像序列路径！")
+                self.extract_status.setText("无效的图像序列路径")
+                return
+            
+            # 获取爆炸时长
+            self.explosion_duration = config.explosion_duration
+            
+            # 加载图像序列
+            success = self.load_image_sequence(image_folder_path, result['image_files'],
+                                               result['first_image'])
+            
+            if success:
+                # 加载温度数据
+                temp_success = self.load_temperature_data(result['time_data'], result['temp_data'])
                 
-                if success:
-                    # 加载温度数据
-                    temp_success = self.load_temperature_data()
-                    
-                    self.extract_status.setText(f"已加载序列: {len(self.image_files)} 个文件，时长: {self.explosion_duration}ms")
-                    print(f"成功加载火球序列: {len(self.image_files)} 个文件")
-                    if temp_success:
-                        print("温度数据加载成功")
-                    else:
-                        print("温度数据加载失败")
+                self.extract_status.setText(f"已加载序列: {len(self.image_files)} 个文件，时长: {self.explosion_duration}ms")
+                print(f"成功加载火球序列: {len(self.image_files)} 个文件")
+                if temp_success:
+                    print("温度数据加载成功")
                 else:
-                    self.extract_status.setText("加载图像序列失败")
-                    
-            except Exception as e:
-                QMessageBox.critical(self, "错误", f"读取序列文件失败:\n{str(e)}")
-                self.extract_status.setText("读取文件失败")
-                print(f"读取序列文件失败: {e}")
-    
-    def load_image_sequence(self, folder_path):
-        """加载图像序列"""
+                    print("温度数据加载失败")
+            else:
+                self.extract_status.setText("加载图像序列失败")
+                
+        except Exception as e:
+            QMessageBox.critical(self, "错误", f"读取序列文件失败:\n{str(e)}")
+            self.extract_status.setText("读取文件失败")
+            print(f"读取序列文件失败: {e}")
+    
+    def load_image_sequence(self, folder_path, image_files, first_image=None):
+        """应用后台扫描得到的图像序列（image_files 为 None 表示文件夹不存在）"""
         try:
-            if not os.path.exists(folder_path):
+            if image_files is None:
                 QMessageBox.warning(self, "警告", f"图像序列文件夹不存在: {folder_path}")
                 return False
             
-            # 检查文件夹中的图像文件
-            image_extensions = ['*.png', '*.jpg', '*.jpeg', '*.bmp', '*.tiff']
-            image_files = []
-            
-            for ext in image_extensions:
-                pattern = os.path.join(folder_path, ext)
-                image_files.extend(glob.glob(pattern))
-                pattern = os.path.join(folder_path, ext.upper())
-                image_files.extend(glob.glob(pattern))
-            
             if image_files:
-                # 按文件名排序
-                image_files.sort()
+                # 移除上一个序列的缓存帧
+                for old_path in self.image_files:
+                    QPixmapCache.remove(self._cache_key(old_path))
                 self.image_files = image_files
                 self.sequence_folder_path = folder_path
                 self.current_image_index = 0
                 
+                # 预先计算各帧对应的实际时间（毫秒）和时间轴标签
+                total_frames = len(image_files)
+                self._time_ms_table = np.linspace(0, self.explosion_duration, total_frames)
+                self._time_labels = [f"t = {t:.1f} ms (帧 {i + 1}/{total_frames})"
+                                     for i, t in enumerate(self._time_ms_table)]
+                if first_image is not None and not first_image.isNull():
+                    # 首帧已在后台解码
+                    QPixmapCache.insert(self._cache_key(image_files[0]),
+                                        QPixmap.fromImage(first_image))
+                
                 # 设置时间轴范围
                 self.extract_slider.setRange(0, len(image_files) - 1)
                 self.extract_slider.setValue(0)
@@ -332,6 +622,9 @@ class ExtractTab(QWidget):
                 # 显示第一张图像
                 self.display_image_at_index(0)
                 
+                # 后台并行解码整段序列
+                self.preload_frames(first_image)
+                
                 return True
             else:
                 QMessageBox.warning(self, "警告", f"文件夹中没有找到图像文件: {folder_path}")
@@ -342,8 +635,40 @@ class ExtractTab(QWidget):
             print(f"加载图像序列失败: {e}")
             return False
     
+    def preload_frames(self, probe=None):
+        """按预览尺寸分配帧数组，并提交到线程池并行解码、缩小所有帧"""
+        # 丢弃上一个序列尚未开始的解码任务
+        self._decode_pool.clear()
+        self.frame_cube = None
+        self._frame_ready = None
+        if probe is None:
+            probe = QImage(self.image_files[0])
+        if probe.isNull():
+            return
+        
+        # 大于预览区域的图像只保留缩略图，内存和绘制开销随之减小
+        size = probe.size()
+        display_size = self.extract_preview.display_size()
+        if size.width() > display_size.width() or size.height() > display_size.height():
+            size = size.scaled(display_size, Qt.KeepAspectRatio)
+        
+        count = len(self.image_files)
+        frame_cube = np.empty((count, size.height(), size.width(), 3), dtype=np.uint8)
+        frame_ready = np.zeros(count, dtype=bool)
+        # 每次加载新序列都换用新数组，旧任务写入的是旧数组，不会串帧
+        self.frame_cube = frame_cube
+        self._frame_ready = frame_ready
+        
+        pool = self._decode_pool
+        for i, image_path in enumerate(self.image_files):
+            pool.start(FrameDecoder(image_path, i, frame_cube, frame_ready))
+    
     def init_charts(self):
-        """初始化图表"""
+        """初始化图表（只执行一次）"""
+        if self._charts_ready:
+            return
+        self._charts_ready = True
+        
         # 初始化温度图表
         self.init_temperature_chart()
         
@@ -353,119 +678,95 @@ class ExtractTab(QWidget):
     def init_temperature_chart(self):
         """初始化温度图表"""
         try:
-            # 清除图表并设置基本样式
-            self.temp_chart.clear()
-            
-            # 添加子图
-            ax = self.temp_chart.figure.add_subplot(111)
-            
-            # 设置图表样式
-            self.temp_chart.figure.patch.set_facecolor('#111827')
-            ax.set_facecolor('#111827')
-            
-            # 设置坐标轴颜色
-            ax.tick_params(colors='#9ca3af', labelsize=9)
-            ax.spines['bottom'].set_color('#374151')
-            ax.spines['top'].set_color('#374151')
-            ax.spines['left'].set_color('#374151')
-            ax.spines['right'].set_color('#374151')
-            
-            # 设置标签颜色
-            ax.set_xlabel("时间 (ms)", color='#e5e7eb', fontsize=10)
-            ax.set_ylabel("温度 (K)", color='#e5e7eb', fontsize=10)
-            ax.set_title("火球温度随时间变化", color='#38bdf8', fontsize=11, fontweight='bold')
-            
-            # 设置坐标轴范围
-            ax.set_xlim(0, 140)
-            ax.set_ylim(1000, 1600)
-            
-            # 显示网格
-            ax.grid(True, alpha=0.3, color='#374151')
-            
-            # 显示提示文本
-            ax.text(70, 1300, "请加载序列文件", 
-                   ha='center', va='center', 
-                   color='#9ca3af', fontsize=10,
-                   bbox=dict(boxstyle="round,pad=0.3", facecolor='#1f2937', alpha=0.8))
-            
-            # 调整布局
-            self.temp_chart.figure.tight_layout(pad=1.0)
-            self.temp_chart.canvas.draw()
-            
+            self._temp_line, self._temp_hint = self._setup_chart(
+                self.temp_chart, "温度 (K)", "火球温度随时间变化",
+                (1000, 1600), "请加载序列文件", '#38bdf8')
         except Exception as e:
             print(f"初始化温度图表失败: {e}")
     
     def init_diameter_chart(self):
         """初始化直径图表"""
         try:
-            # 清除图表并设置基本样式
-            self.diam_chart.clear()
-            
-            # 添加子图
-            ax = self.diam_chart.figure.add_subplot(111)
-            
-            # 设置图表样式
-            self.diam_chart.figure.patch.set_facecolor('#111827')
-            ax.set_facecolor('#111827')
-            
-            # 设置坐标轴颜色
-            ax.tick_params(colors='#9ca3af', labelsize=9)
-            ax.spines['bottom'].set_color('#374151')
-            ax.spines['top'].set_color('#374151')
-            ax.spines['left'].set_color('#374151')
-            ax.spines['right'].set_color('#374151')
-            
-            # 设置标签颜色
-            ax.set_xlabel("时间 (ms)", color='#e5e7eb', fontsize=10)
-            ax.set_ylabel("直径 (m)", color='#e5e7eb', fontsize=10)
-            ax.set_title("火球直径随时间变化", color='#38bdf8', fontsize=11, fontweight='bold')
-            
-            # 设置坐标轴范围
-            ax.set_xlim(0, 140)
-            ax.set_ylim(0, 2)
-            
-            # 显示网格
-            ax.grid(True, alpha=0.3, color='#374151')
-            
-            # 显示提示文本
-            ax.text(70, 1, "提取完成后显示", 
-                   ha='center', va='center', 
-                   color='#9ca3af', fontsize=10,
-                   bbox=dict(boxstyle="round,pad=0.3", facecolor='#1f2937', alpha=0.8))
-            
-            # 调整布局
-            self.diam_chart.figure.tight_layout(pad=1.0)
-            self.diam_chart.canvas.draw()
-            
+            self._diam_line, self._diam_hint = self._setup_chart(
+                self.diam_chart, "直径 (m)", "火球直径随时间变化",
+                (0, 2), "提取完成后显示", '#f59e0b')
         except Exception as e:
             print(f"初始化直径图表失败: {e}")
     
-    def load_temperature_data(self):
-        """加载温度数据并更新图表"""
+    def _setup_chart(self, chart, ylabel, title, ylim, hint, color):
+        """一次性设置坐标轴样式，返回之后复用的曲线和提示文本"""
+        # 清除图表并设置基本样式
+        chart.clear()
+        
+        # 添加子图
+        ax = chart.figure.add_subplot(111)
+        
+        # 设置图表样式
+        chart.figure.patch.set_facecolor('#111827')
+        ax.set_facecolor('#111827')
+        
+        # 设置坐标轴颜色
+        ax.tick_params(colors='#9ca3af', labelsize=9)
+        for spine in ax.spines.values():
+            spine.set_color('#374151')
+        
+        # 设置标签颜色
+        ax.set_xlabel("时间 (ms)", color='#e5e7eb', fontsize=10)
+        ax.set_ylabel(ylabel, color='#e5e7eb', fontsize=10)
+        ax.set_title(title, color='#38bdf8', fontsize=11, fontweight='bold')
+        
+        # 设置坐标轴范围
+        ax.set_xlim(0, 140)
+        ax.set_ylim(*ylim)
+        
+        # 显示网格
+        ax.grid(True, alpha=0.3, color='#374151')
+        
+        # 数据曲线（先为空，更新时只替换数据并局部 blit）
+        line, = ax.plot([], [], color=color, linewidth=2)
+        chart.track_line(line)
+        
+        # 显示提示文本
+        hint_text = ax.text(70, sum(ylim) / 2, hint, 
+                            ha='center', va='center', 
+                            color='#9ca3af', fontsize=10,
+                            bbox=dict(boxstyle="round,pad=0.3", facecolor='#1f2937', alpha=0.8))
+        
+        # 固定边距，避免 tight_layout 每次测量所有文字；尺寸变化时重新换算
+        self._apply_margins(chart.figure)
+        chart.canvas.mpl_connect('resize_event',
+                                 lambda event: self._apply_margins(chart.figure))
+        chart.canvas.draw()
+        return line, hint_text
+    
+    @staticmethod
+    def _apply_margins(figure, left=0.6, right=0.12, top=0.28, bottom=0.4):
+        """按固定边距（英寸，与字号同比缩放）设置子图位置，常数时间，不测量文字"""
+        width, height = figure.get_size_inches()
+        figure.subplots_adjust(left=min(left / width, 0.4), right=max(1 - right / width, 0.6),
+                               top=max(1 - top / height, 0.6), bottom=min(bottom / height, 0.4))
+    
+    def _set_chart_data(self, chart, line, hint, x_data, y_data):
+        """替换曲线数据，不重建坐标轴
+        
+        由 MatplotlibWidget.update_line 局部 blit；首次显示数据时隐藏提示并整幅重绘。
+        """
+        x = np.asarray(x_data, dtype=float)
+        y = np.asarray(y_data, dtype=float)
+        # 点数超过画布宽度两倍时降采样，线条渲染量与数据量无关
+        x, y = _decimate(x, y, max(2 * chart.canvas.width(), 200))
+        if hint.get_visible():
+            hint.set_visible(False)
+            line.set_data(x, y)
+            line.axes.relim()
+            line.axes.autoscale()
+            chart.canvas.draw()
+            return
+        chart.update_line(x, y)
+    
+    def load_temperature_data(self, time_data, temp_data):
+        """用后台读取的温度数据更新图表"""
         try:
-            print("开始加载温度数据...")
-            
-            if not self.sequence_data:
-                print("❌ 没有序列数据，无法加载温度数据")
-                return False
-            
-            # 获取温度文件路径
-            temp_file_path = self.sequence_data.get('files', {}).get('temperature_file', '')
-            print(f"温度文件路径: {temp_file_path}")
-            
-            if not temp_file_path or temp_file_path == "未设置":
-                print("❌ 没有温度文件路径")
-                return False
-            
-            # 检查文件是否存在
-            if not os.path.exists(temp_file_path):
-                print(f"❌ 温度文件不存在: {temp_file_path}")
-                return False
-            
-            print(f"✅ 温度文件存在，开始读取...")
-            
-            # 读取温度数据
-            time_data, temp_data = self._read_temperature_csv(temp_file_path)
             if time_data is None or temp_data is None:
                 print("❌ 读取温度数据失败")
                 return False
@@ -484,44 +785,27 @@ class ExtractTab(QWidget):
             return False
     
     def _read_temperature_csv(self, file_path):
-        """读取温度CSV文件"""
+        """读取温度CSV文件（第一行为标题，前两列为时间、温度）"""
         try:
-            print(f"开始读取CSV文件: {file_path}")
-            time_data = []
-            temp_data = []
-            
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            print(f"文件总行数: {len(lines)}")
-            if len(lines) > 0:
-                print(f"第一行（标题）: {lines[0].strip()}")
-            
-            # 跳过标题行
-            for i, line in enumerate(lines[1:], 1):
-                line = line.strip()
-                if line and ',' in line:
-                    parts = line.split(',')
-                    if len(parts) >= 2:
-                        try:
-                            time_val = float(parts[0])
-                            temp_val = float(parts[1])
-                            time_data.append(time_val)
-                            temp_data.append(temp_val)
-                        except ValueError as e:
-                            print(f"第{i+1}行数据格式错误: {line}, 错误: {e}")
-                            continue
-                    else:
-                        print(f"第{i+1}行列数不足: {line}")
-                else:
-                    print(f"第{i+1}行格式错误: {line}")
+            debug = logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                logger.debug(f"开始读取CSV文件: {file_path}")
+            try:
+                data = np.loadtxt(file_path, delimiter=',', skiprows=1, usecols=(0, 1),
+                                  dtype=np.float64, ndmin=2, encoding='utf-8')
+            except ValueError as e:
+                # 存在格式错误的行时用正则一次匹配全文，丢弃无效行
+                print(f"CSV中存在格式错误的行，跳过无效行: {e}")
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    f.readline()  # 跳过标题行
+                    rows = _CSV_ROW_RE.findall(f.read())
+                data = np.asarray(rows, dtype=np.float64).reshape(-1, 2)
             
-            print(f"成功解析 {len(time_data)} 个数据点")
+            time_data, temp_data = data[:, 0], data[:, 1]
             
-            if time_data and temp_data:
-                print(f"✅ 成功读取温度数据: {len(time_data)} 个点")
-                print(f"   时间范围: {min(time_data)} - {max(time_data)} ms")
-                print(f"   温度范围: {min(temp_data)} - {max(temp_data)} K")
+            if len(time_data):
+                if debug:
+                    logger.debug(f"成功读取温度数据: {len(time_data)} 个点")
                 return time_data, temp_data
             else:
                 print("❌ 没有找到有效的温度数据")
@@ -536,18 +820,16 @@ class ExtractTab(QWidget):
     def update_temperature_chart(self, time_data, temp_data):
         """更新温度图表"""
         try:
+            self.init_charts()
             print(f"开始更新温度图表: {len(time_data)} 个数据点")
             
-            # 使用 MatplotlibWidget 的 plot_line 方法
-            print(f"绘制温度曲线: 时间范围 {min(time_data)}-{max(time_data)} ms, 温度范围 {min(temp_data)}-{max(temp_data)} K")
+            if logger.isEnabledFor(logging.DEBUG):
+                # 数据范围只在调试时统计一次（numpy 向量化）
+                logger.debug(f"绘制温度曲线: 时间范围 {np.min(time_data)}-{np.max(time_data)} ms, "
+                             f"温度范围 {np.min(temp_data)}-{np.max(temp_data)} K")
             
-            self.temp_chart.plot_line(
-                time_data, temp_data,
-                title="火球温度随时间变化",
-                xlabel="时间 (ms)",
-                ylabel="温度 (K)",
-                color='#38bdf8'
-            )
+            self._set_chart_data(self.temp_chart, self._temp_line, self._temp_hint,
+                                 time_data, temp_data)
             
             print("✅ 温度图表更新完成")
             
@@ -559,16 +841,11 @@ class ExtractTab(QWidget):
     def update_diameter_chart(self, time_data, diameter_data):
         """更新直径图表（提取完成后调用）"""
         try:
+            self.init_charts()
             print(f"开始更新直径图表: {len(time_data)} 个数据点")
             
-            # 使用 MatplotlibWidget 的 plot_line 方法
-            self.diam_chart.plot_line(
-                time_data, diameter_data,
-                title="火球直径随时间变化",
-                xlabel="时间 (ms)",
-                ylabel="直径 (m)",
-                color='#f59e0b'
-            )
+            self._set_chart_data(self.diam_chart, self._diam_line, self._diam_hint,
+                                 time_data, diameter_data)
             
             print("✅ 直径图表更新完成")
             
@@ -585,61 +862,45 @@ class ExtractTab(QWidget):
             self.extract_btn.setEnabled(False)
             
             # 检查是否有序列数据
-            if not self.sequence_data:
+            if self.sequence_config is None:
                 QMessageBox.warning(self, "警告", "请先加载火球爆炸序列文件！")
                 self.extract_status.setText("请先加载序列文件")
                 self.extract_btn.setEnabled(True)
                 return
             
             # 获取材料类型（从序列数据中获取）
-            material_type = self.sequence_data.get('parameters', {}).get('material_type', '40%Al/Rubber')
+            material_type = self.sequence_config.material_type
             
             # 映射材料类型到计算器中的名称
-            material_mapping = {
-                '40% Al / Rubber': '40%Al/Rubber',
-                '30% Al / Rubber': '30%Al/Rubber', 
-                '50% Al / Rubber': '50%Al/Rubber',
-                '60% Al / Rubber': '60%Al/Rubber',
-                'Polyurethane': 'Polyurethane'
-            }
-            
-            material_name = material_mapping.get(material_type, '40%Al/Rubber')
+            material_name = self.MATERIAL_NAMES.get(material_type, '40%Al/Rubber')
             print(f"使用材料类型: {material_name}")
             
-            # 计算火球直径随时间变化
-            self.calculate_fireball_diameter_curve(material_name)
+            # 同一材料和爆炸时长的直径曲线只计算一次
+            cached = self._diameter_curves.get((material_name, self.explosion_duration))
+            if cached is not None:
+                self._on_extraction_finished(cached)
+                return
             
-            # 更新状态
-            self.extract_status.setText("特征提取完成")
-            self.save_button.setEnabled(True)
-            self.extract_btn.setEnabled(True)
-            
-            print("✅ 特征提取完成！")
+            # 数值计算在线程池中进行，完成后由 _on_extraction_finished 更新界面
+            self._extraction_worker = ExtractionWorker(
+                self.fireball_calculator, material_name, self.explosion_duration)
+            self._extraction_worker.signals.finished.connect(self._on_extraction_finished)
+            QThreadPool.globalInstance().start(self._extraction_worker)
             
         except Exception as e:
-            print(f"❌ 特征提取失败: {e}")
             import traceback
             traceback.print_exc()
-            self.extract_status.setText("特征提取失败")
-            self.extract_btn.setEnabled(True)
-            QMessageBox.critical(self, "错误", f"特征提取失败:\n{str(e)}")
+            self._extraction_failed(e)
     
-    def calculate_fireball_diameter_curve(self, material_name):
-        """计算火球直径随时间变化的曲线"""
+    def _on_extraction_finished(self, result):
+        """特征提取计算完成（GUI 线程）"""
+        if result['error'] is not None:
+            self._extraction_failed(result['error'])
+            return
+        self._diameter_curves[(result['material'], result['explosion_duration'])] = result
         try:
-            print(f"计算 {material_name} 材料的火球直径曲线...")
-            
-            # 生成时间序列 (0-140ms)
-            time_points = 100  # 时间点数量
-            t_ms = np.linspace(0, self.explosion_duration, time_points)  # 毫秒
-            t_s = t_ms / 1000.0  # 转换为秒
-            
-            # 计算直径
-            diameter_data = []
-            for t in t_s:
-                diameter = self.fireball_calculator.calculate_diameter(t, material_name)
-                diameter_data.append(diameter)
-            
+            t_ms = result['time_ms']
+            diameter_data = result['diameter_m']
             print(f"✅ 火球直径计算完成: {len(diameter_data)} 个数据点")
             print(f"   时间范围: {min(t_ms)} - {max(t_ms)} ms")
             print(f"   直径范围: {min(diameter_data):.3f} - {max(diameter_data):.3f} m")
@@ -651,12 +912,25 @@ class ExtractTab(QWidget):
             self.extraction_results = {
                 'time_ms': t_ms.tolist(),
                 'diameter_m': diameter_data,
-                'material': material_name,
-                'explosion_duration': self.explosion_duration
+                'material': result['material'],
+                'explosion_duration': result['explosion_duration']
             }
             
+            # 更新状态
+            self.extract_status.setText("特征提取完成")
+            self.save_button.setEnabled(True)
+            self.extract_btn.setEnabled(True)
+            
+            print("✅ 特征提取完成！")
+            
         except Exception as e:
-            print(f"❌ 计算火球直径曲线失败: {e}")
             import traceback
             traceback.print_exc()
-            raise e
+            self._extraction_failed(e)
+    
+    def _extraction_failed(self, error):
+        """特征提取失败时提示并恢复按钮状态"""
+        print(f"❌ 特征提取失败: {error}")
+        self.extract_status.setText("特征提取失败")
+        self.extract_btn.setEnabled(True)
+        QMessageBox.critical(self, "错误", f"特征提取失败:\n{str(error)}")
@@ -7,29 +7,112 @@
 
 import sys
 import os
+import numpy as np
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                                QHBoxLayout, QTabWidget, QLabel, QPushButton, 
                                QLineEdit, QComboBox, QSlider, QProgressBar,
                                QTextEdit, QFileDialog, QCheckBox, QGroupBox,
-                               QGridLayout, QSplitter, QFrame, QScrollArea)
-from PySide6.QtCore import Qt, QTimer, Signal, QThread, QSize
-from PySide6.QtGui import QFont, QPalette, QColor, QPixmap, QPainter, QPen
-import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
+                               QGridLayout, QSplitter, QFrame, QScrollArea,
+                               QStackedWidget)
+from PySide6.QtCore import (Qt, QTimer, Signal, QThread, QSize, QObject,
+                            QRunnable, QThreadPool)
+from PySide6.QtGui import (QFont, QPalette, QColor, QPixmap, QPainter, QPen,
+                           QImage, QResizeEvent, QPixmapCache)
 import matplotlib
-matplotlib.use('Qt5Agg')
+matplotlib.use('QtAgg')
+# 图表统一的深色样式和中文字体，创建坐标轴时即生效，不必每次绘图逐项设置
+matplotlib.rcParams.update({
+    'font.sans-serif': ['SimHei', 'Arial Unicode MS', 'DejaVu Sans'],
+    'axes.unicode_minus': False,
+    'figure.facecolor': '#0b1220',
+    'axes.facecolor': '#0b1220',
+    'axes.labelcolor': '#e5e7eb',
+    'axes.labelsize': 10,
+    'axes.titlecolor': '#38bdf8',
+    'axes.titlesize': 12,
+    'axes.grid': True,
+    'grid.alpha': 0.3,
+    'legend.labelcolor': '#e5e7eb',
+    'xtick.color': '#e5e7eb',
+    'ytick.color': '#e5e7eb',
+})
+from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.figure import Figure
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
+from matplotlib.colors import to_rgba
 
-# 导入计算模块
+# 计算模块所在目录；计算模块在用到时才导入，避免拖慢启动
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from fireball_radius_calculator import FireballCalculator
-from fireball_temperature_calculator import FireballTemperatureCalculator
-from transmissivity_calculator import TransmissivityParams, transmissivity
-from fireball_heat_radiation_calculator import (compute_temperature_profile, 
-                                               compute_diameter_profile,
-                                               compute_heat_flux_over_time,
-                                               integrate_heat_radiation)
+
+# 图表颜色，模块加载时解析一次为 RGBA，绘图时不再逐次解析十六进制串
+_PALETTE = [to_rgba(c) for c in ('#5f0f40', '#2a4d69', '#4f9d9d', '#8acb88', '#f4d35e')]
+_LINE_COLOR = to_rgba('#38bdf8')
+
+# 应用级深色主题样式表
+THEME_QSS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'theme.qss')
+
+
+class CachedFigureCanvas(FigureCanvas):
+    """缓存渲染结果的画布
+    
+    每次绘制后保存一份位图；窗口缩放过程中只拉伸显示该位图，
+    缩放停止后才按新尺寸重新栅格化，数据不变时不重复渲染。
+    """
+    
+    RESIZE_SETTLE_MS = 150  # 缩放停止多久后重新渲染
+    
+    def __init__(self, figure):
+        super().__init__(figure)
+        self._pixmap = None
+        self._pixmap_stale = False
+        self._pending_resize = None
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(self.RESIZE_SETTLE_MS)
+        self._resize_timer.timeout.connect(self._apply_resize)
+        
+    def draw(self):
+        super().draw()
+        self._update_pixmap()
+        
+    def _update_pixmap(self):
+        """从 Agg 缓冲区生成缓存位图"""
+        buf = self.buffer_rgba()
+        image = QImage(buf, buf.shape[1], buf.shape[0], QImage.Format_RGBA8888)
+        self._pixmap = QPixmap.fromImage(image)
+        self._pixmap.setDevicePixelRatio(self.device_pixel_ratio)
+        self._pixmap_stale = False
+        
+    def blit(self, bbox=None):
+        # 局部刷新只标记缓存过期，等需要拉伸显示时再重新生成
+        super().blit(bbox)
+        self._pixmap_stale = True
+        
+    def resizeEvent(self, event):
+        if self._pixmap is None:
+            super().resizeEvent(event)
+            return
+        if self._pixmap_stale:
+            self._update_pixmap()
+        # 先拉伸显示缓存位图，延迟到缩放结束再调整图表尺寸并重绘
+        QWidget.resizeEvent(self, event)
+        self._pending_resize = QResizeEvent(event.size(), event.oldSize())
+        self._resize_timer.start()
+        self.update()
+        
+    def _apply_resize(self):
+        event, self._pending_resize = self._pending_resize, None
+        if event is not None:
+            super().resizeEvent(event)
+            
+    def paintEvent(self, event):
+        if self._pending_resize is not None:
+            painter = QPainter(self)
+            painter.drawPixmap(self.rect(), self._pixmap)
+            painter.end()
+            return
+        super().paintEvent(event)
 
 
 class MatplotlibWidget(QWidget):
@@ -38,119 +121,309 @@ class MatplotlibWidget(QWidget):
     def __init__(self, parent=None, width=5, height=4, dpi=100):
         super().__init__(parent)
         self.figure = Figure(figsize=(width, height), dpi=dpi)
-        self.canvas = FigureCanvas(self.figure)
+        self.canvas = CachedFigureCanvas(self.figure)
+        
+        # blit 局部刷新用的坐标轴、动态曲线和背景缓存
+        self.ax = None
+        self._line = None
+        self._bg = None
+        # 当前坐标轴由哪个绘图方法创建（'line' / 'multi'），同类调用直接复用
+        self._plot_mode = None
+        self._collection = None  # plot_multiple_lines 的全部曲线（单个 LineCollection）
+        self._legend_labels = None  # 当前图例的标签顺序
+        self._labels = None  # 当前的 (标题, x 轴标签, y 轴标签)
+        # 每次整幅重绘（包括缩放后）都刷新背景缓存
+        self.canvas.mpl_connect('draw_event', self._on_draw)
         
         layout = QVBoxLayout()
         layout.addWidget(self.canvas)
         self.setLayout(layout)
         
+    def _reset_blit(self):
+        self.ax = None
+        self._line = None
+        self._bg = None
+        self._plot_mode = None
+        self._collection = None
+        self._legend_labels = None
+        self._labels = None
+        
+    def _on_draw(self, event):
+        """整幅重绘后保存不含动态曲线的背景，再补画曲线"""
+        if self._line is None:
+            return
+        self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.ax.draw_artist(self._line)
+        
+    def track_line(self, line):
+        """登记一条已有曲线，之后由 update_line 局部刷新"""
+        line.set_animated(True)
+        self.ax = line.axes
+        self._line = line
+        self._bg = None
+        self._plot_mode = None
+        
     def clear(self):
         self.figure.clear()
-        self.canvas.draw()
+        self._reset_blit()
+        self.canvas.draw_idle()
         
-    def plot_line(self, x_data, y_data, title="", xlabel="", ylabel="", color='#38bdf8'):
-        """绘制单条线图"""
+    def _new_axes(self, mode):
+        """清空图表并创建坐标轴（样式由 rcParams 统一设置）"""
         self.figure.clear()
+        self._reset_blit()
         ax = self.figure.add_subplot(111)
-        ax.plot(x_data, y_data, color=color, linewidth=2)
-        ax.set_title(title, fontsize=12, color='#38bdf8')
-        ax.set_xlabel(xlabel, fontsize=10)
-        ax.set_ylabel(ylabel, fontsize=10)
-        ax.grid(True, alpha=0.3)
-        ax.set_facecolor('#0b1220')
-        self.figure.patch.set_facecolor('#0b1220')
-        ax.tick_params(colors='#e5e7eb')
-        self.canvas.draw()
+        self.ax = ax
+        self._plot_mode = mode
+        return ax
+        
+    def _set_labels(self, title, xlabel, ylabel):
+        """标题和坐标轴标签有变化时才更新，返回是否有变化"""
+        labels = (title, xlabel, ylabel)
+        if labels == self._labels:
+            return False
+        self._labels = labels
+        self.ax.set_title(title)
+        self.ax.set_xlabel(xlabel)
+        self.ax.set_ylabel(ylabel)
+        return True
+        
+    def plot_line(self, x_data, y_data, title="", xlabel="", ylabel="", color=_LINE_COLOR):
+        """绘制单条线图（坐标轴和曲线只创建一次，之后只替换数据）"""
+        # 列表等输入在入口处统一转换一次，后续 set_data / relim 都直接用数组
+        x_data = np.asarray(x_data, dtype=float)
+        y_data = np.asarray(y_data, dtype=float)
+        limits = None
+        if self._plot_mode == 'line':
+            limits = (self.ax.get_xlim(), self.ax.get_ylim())
+            self._line.set_data(x_data, y_data)
+            self._line.set_color(color)
+            self.ax.relim()
+            self.ax.autoscale_view()
+        else:
+            ax = self._new_axes('line')
+            # 曲线设为 animated，由 _on_draw / update_line 单独绘制
+            self._line = ax.plot(x_data, y_data, color=color, linewidth=2, animated=True)[0]
+        labels_changed = self._set_labels(title, xlabel, ylabel)
+        if (self._bg is not None and not labels_changed
+                and limits == (self.ax.get_xlim(), self.ax.get_ylim())):
+            # 重复绘制（如再次预测）时坐标轴和标签都没变，背景可复用，只 blit 曲线
+            self._blit_line()
+        else:
+            self.canvas.draw_idle()
+        
+    def update_line(self, x_data, y_data):
+        """更新 plot_line / track_line 的曲线数据，用于动画和实时刷新
+        
+        数据在当前坐标范围内时只局部 blit 曲线；超出范围时调整范围并整幅重绘。
+        """
+        if self._line is None:
+            self.plot_line(x_data, y_data)
+            return
+        x = np.asarray(x_data, dtype=float)
+        y = np.asarray(y_data, dtype=float)
+        self._line.set_data(x, y)
+        if self._bg is None or not self._within_limits(x, y):
+            self.ax.relim()
+            self.ax.autoscale()
+            self.canvas.draw()
+            return
+        self._blit_line()
+        
+    def _blit_line(self):
+        """恢复背景缓存并只重画动态曲线"""
+        self.canvas.restore_region(self._bg)
+        self.ax.draw_artist(self._line)
+        self.canvas.blit(self.ax.bbox)
+        
+    def _within_limits(self, x, y):
+        if not len(x):
+            return True
+        x0, x1 = self.ax.get_xlim()
+        y0, y1 = self.ax.get_ylim()
+        return x0 <= x.min() and x.max() <= x1 and y0 <= y.min() and y.max() <= y1
         
     def plot_multiple_lines(self, data_dict, title="", xlabel="", ylabel=""):
-        """绘制多条线图"""
-        self.figure.clear()
-        ax = self.figure.add_subplot(111)
-        
-        colors = ['#5f0f40', '#2a4d69', '#4f9d9d', '#8acb88', '#f4d35e']
-        
-        for i, (label, (x_data, y_data)) in enumerate(data_dict.items()):
-            color = colors[i % len(colors)]
-            ax.plot(x_data, y_data, color=color, linewidth=2, label=label)
-            
-        ax.set_title(title, fontsize=12, color='#38bdf8')
-        ax.set_xlabel(xlabel, fontsize=10)
-        ax.set_ylabel(ylabel, fontsize=10)
-        ax.grid(True, alpha=0.3)
-        ax.legend()
-        ax.set_facecolor('#0b1220')
-        self.figure.patch.set_facecolor('#0b1220')
-        ax.tick_params(colors='#e5e7eb')
-        self.canvas.draw()
+        """绘制多条线图（data_dict: 标签 -> (x, y)，各曲线可使用不同的 x）"""
+        segments = [np.column_stack((x_data, y_data)) for x_data, y_data in data_dict.values()]
+        self._plot_segments(segments, list(data_dict), title, xlabel, ylabel)
+        
+    def plot_matrix(self, x, Y, labels, title="", xlabel="", ylabel=""):
+        """绘制共用同一 x 轴的多条线图
+        
+        x 形状为 (n_points,)，Y 形状为 (n_series, n_points)，每行一条曲线。
+        线段数组一次性构造，不逐条处理。
+        """
+        Y = np.asarray(Y, dtype=float)
+        segments = np.dstack((np.broadcast_to(np.asarray(x, dtype=float), Y.shape), Y))
+        self._plot_segments(segments, list(labels), title, xlabel, ylabel)
+        
+    def _plot_segments(self, segments, labels, title, xlabel, ylabel):
+        """多条线图的公共实现
+        
+        所有曲线放在同一个 LineCollection 中，只有一个绘制对象；再次调用时
+        只替换线段数据，标签变化时才重建图例。
+        """
+        if self._plot_mode == 'multi':
+            ax = self.ax
+        else:
+            ax = self._new_axes('multi')
+            self._collection = LineCollection([], linewidths=2)
+            ax.add_collection(self._collection)
+        
+        line_colors = [_PALETTE[i % len(_PALETTE)] for i in range(len(labels))]
+        self._collection.set_segments(segments)
+        self._collection.set_colors(line_colors)
+        
+        if labels != self._legend_labels:
+            # 集合没有逐条的图例句柄，用空曲线作为图例代理
+            self._legend_labels = labels
+            handles = [Line2D([], [], color=c, linewidth=2) for c in line_colors]
+            ax.legend(handles, labels)
+        
+        # relim 不统计集合，直接按全部线段的点重设数据范围
+        ax.ignore_existing_data_limits = True
+        if len(segments):
+            ax.update_datalim(np.concatenate(list(segments)))
+        ax.autoscale_view()
+        self._set_labels(title, xlabel, ylabel)
+        self.canvas.draw_idle()
 
 
 class ImagePreviewWidget(QWidget):
     """图像预览组件"""
     
+    PIXMAP_CACHE_LIMIT_KB = 32 * 1024  # 预览缓存所需的 QPixmapCache 容量下限（KB）
+    
     def __init__(self, parent=None):
         super().__init__(parent)
+        if QPixmapCache.cacheLimit() < self.PIXMAP_CACHE_LIMIT_KB:
+            QPixmapCache.setCacheLimit(self.PIXMAP_CACHE_LIMIT_KB)
         self.setMinimumSize(400, 300)
         self.setMaximumSize(600, 450)  # 设置最大尺寸
         self.setFixedSize(500, 375)    # 设置固定尺寸
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #050a16;
-                border: 1px solid #1f2937;
-                border-radius: 10px;
-            }
-        """)
+        self.setObjectName("ImagePreview")
         
         layout = QVBoxLayout()
         layout.setContentsMargins(5, 5, 5, 5)  # 设置边距
         self.image_label = QLabel("预览图像")
         self.image_label.setAlignment(Qt.AlignCenter)
         self.image_label.setScaledContents(False)  # 禁用自动缩放内容
-        self.image_label.setStyleSheet("""
-            QLabel {
-                color: #9ca3af;
-                font-size: 14px;
-                background-color: transparent;
-            }
-        """)
+        self.image_label.setObjectName("ImagePreviewLabel")
         layout.addWidget(self.image_label)
         self.setLayout(layout)
         
+        # 当前图像的原始位图（或其文件），尺寸变化时据此重新缩放
+        self._source_pixmap = None
+        self._source_file = None
+        # 缩放过程中先用快速缩放，停止变化后再平滑缩放一次
+        self._scale_timer = QTimer(self)
+        self._scale_timer.setSingleShot(True)
+        self._scale_timer.setInterval(120)
+        self._scale_timer.timeout.connect(self._finalize_scale)
+        
+    def display_size(self):
+        """图像实际可用的显示尺寸（去掉边距）"""
+        return self.contentsRect().marginsRemoved(self.layout().contentsMargins()).size()
+        
     def set_image(self, image_path):
-        """设置预览图像"""
-        if os.path.exists(image_path):
-            pixmap = QPixmap(image_path)
-            # 使用固定尺寸缩放，不改变组件大小
-            # 获取标签的可用尺寸（减去边距）
-            label_size = self.image_label.size()
-            if label_size.width() > 0 and label_size.height() > 0:
-                # 缩放图像以适应标签尺寸，保持宽高比
-                scaled_pixmap = pixmap.scaled(
-                    label_size, 
-                    Qt.KeepAspectRatio, 
-                    Qt.SmoothTransformation
-                )
-                self.image_label.setPixmap(scaled_pixmap)
-            else:
-                # 如果标签还没有尺寸，使用组件尺寸
-                widget_size = self.size()
-                if widget_size.width() > 0 and widget_size.height() > 0:
-                    scaled_pixmap = pixmap.scaled(
-                        widget_size, 
-                        Qt.KeepAspectRatio, 
-                        Qt.SmoothTransformation
-                    )
-                    self.image_label.setPixmap(scaled_pixmap)
-                else:
-                    self.image_label.setPixmap(pixmap)
-        else:
+        """设置预览图像
+        
+        缩放结果按 (路径, 修改时间, 尺寸) 缓存在 QPixmapCache 中，同一张图
+        重复显示时不再解码和缩放；尺寸变化时只重新缩放，不重新解码。
+        """
+        if not os.path.exists(image_path):
             self.image_label.setText("预览图像")
+            return
+        mtime = os.path.getmtime(image_path)
+        self._source_pixmap = None
+        self._source_file = (image_path, mtime)
+        size = self._target_size()
+        key = f"preview:{image_path}:{mtime}:{size.width()}x{size.height()}"
+        scaled_pixmap = QPixmapCache.find(key)
+        if scaled_pixmap is None:
+            scaled_pixmap = self._scaled(self._source(), size)
+            QPixmapCache.insert(key, scaled_pixmap)
+        self.image_label.setPixmap(scaled_pixmap)
+            
+    def set_pixmap(self, pixmap):
+        """显示已解码的图像"""
+        self._source_pixmap = pixmap
+        self._source_file = None
+        self.image_label.setPixmap(self._scaled(pixmap, self._target_size()))
+        
+    def _source(self):
+        """当前图像的原始位图；来自文件时按 (路径, 修改时间) 从缓存取或解码"""
+        if self._source_pixmap is None and self._source_file is not None:
+            image_path, mtime = self._source_file
+            source_key = f"preview-src:{image_path}:{mtime}"
+            pixmap = QPixmapCache.find(source_key)
+            if pixmap is None:
+                pixmap = QPixmap(image_path)
+                QPixmapCache.insert(source_key, pixmap)
+            self._source_pixmap = pixmap
+        return self._source_pixmap
+        
+    def resizeEvent(self, event):
+        """尺寸变化时用快速缩放即时跟随，停止变化后再平滑缩放"""
+        super().resizeEvent(event)
+        source = self._source()
+        if source is None:
+            return
+        size = self._target_size()
+        if size.width() > 0 and size.height() > 0:
+            self.image_label.setPixmap(
+                source.scaled(size, Qt.KeepAspectRatio, Qt.FastTransformation))
+        self._scale_timer.start()
+        
+    def _finalize_scale(self):
+        """尺寸稳定后用平滑缩放重新显示"""
+        source = self._source()
+        if source is not None:
+            self.image_label.setPixmap(self._scaled(source, self._target_size()))
+        
+    def _target_size(self):
+        """图像缩放的目标尺寸：优先用标签尺寸，标签还没有尺寸时用组件尺寸"""
+        label_size = self.image_label.size()
+        if label_size.width() > 0 and label_size.height() > 0:
+            return label_size
+        return self.size()
+        
+    @staticmethod
+    def _scaled(pixmap, size):
+        """缩放图像以适应目标尺寸，保持宽高比；尺寸无效时返回原图"""
+        if size.width() <= 0 or size.height() <= 0:
+            return pixmap
+        return pixmap.scaled(size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
     
     def clear(self):
         """清空图像预览"""
+        self._source_pixmap = None
+        self._source_file = None
+        self._scale_timer.stop()
         self.image_label.clear()
         self.image_label.setText("预览图像")
 
 
+class ModelLoaderSignals(QObject):
+    """模型加载信号（QRunnable 不是 QObject，信号需单独定义）"""
+    modelsReady = Signal(object)
+
+
+class ModelLoader(QRunnable):
+    """后台线程中加载特征提取所用的计算模型"""
+    
+    def __init__(self):
+        super().__init__()
+        self.signals = ModelLoaderSignals()
+        
+    def run(self):
+        # 计算模块（连同 pyplot）在工作线程中导入，不占用 GUI 线程的启动时间
+        from fireball_radius_calculator import FireballCalculator
+        calculator = FireballCalculator()
+        self.signals.modelsReady.emit(calculator)
+
+
 class SidebarWidget(QWidget):
     """侧边栏组件"""
     
@@ -161,32 +434,15 @@ class SidebarWidget(QWidget):
     def init_ui(self):
         layout = QVBoxLayout()
         
-        # 侧边栏容器，由各个标签页填充
-        self.sidebar_container = QWidget()
+        # 侧边栏容器，由各个标签页填充；同一时刻只显示并布局一页
+        self.sidebar_container = QStackedWidget()
         layout.addWidget(self.sidebar_container)
         
         self.setLayout(layout)
         
     def set_sidebar_content(self, content_widget):
         """设置侧边栏内容"""
-        # 如果还没有布局，创建一个
-        if not self.sidebar_container.layout():
-            layout = QVBoxLayout()
-            self.sidebar_container.setLayout(layout)
-        
-        # 隐藏所有现有的侧边栏内容
-        for i in range(self.sidebar_container.layout().count()):
-            child = self.sidebar_container.layout().itemAt(i)
-            if child and child.widget():
-                child.widget().hide()
-        
-        # 如果控件不在布局中，添加到布局
-        if content_widget.parent() != self.sidebar_container:
-            self.sidebar_container.layout().addWidget(content_widget)
-        
-        # 显示新的侧边栏内容
-        content_widget.show()
-        
+        self.sidebar_container.setCurrentWidget(content_widget)
 
 
 class FireballAnalysisApp(QMainWindow):
@@ -216,29 +472,7 @@ class FireballAnalysisApp(QMainWindow):
         
         # 右侧标签页区域
         self.tab_widget = QTabWidget()
-        self.tab_widget.setStyleSheet("""
-            QTabWidget::pane {
-                border: 1px solid #1f2937;
-                background-color: #111827;
-            }
-            QTabBar::tab {
-                background-color: #0b1220;
-                color: #e5e7eb;
-                padding: 8px 12px;
-                margin-right: 2px;
-                border: 1px solid #1f2937;
-                border-bottom: none;
-                border-top-left-radius: 8px;
-                border-top-right-radius: 8px;
-            }
-            QTabBar::tab:selected {
-                background-color: #111827;
-                border-color: #38bdf8;
-            }
-            QTabBar::tab:hover {
-                background-color: #1f2937;
-            }
-        """)
+        self.tab_widget.setObjectName("MainTabs")
         
         # 导入各个标签页
         from input_tab import InputTab
@@ -264,96 +498,31 @@ class FireballAnalysisApp(QMainWindow):
         # 状态栏
         self.statusBar().showMessage("状态: 空闲")
         
+        self._load_all_sidebars()
+        
+    def load_models(self):
+        """在线程池中加载模型，完成后通知特征提取页"""
+        self._model_loader = ModelLoader()
+        self._model_loader.signals.modelsReady.connect(self.extract_tab.on_models_ready)
+        QThreadPool.globalInstance().start(self._model_loader)
+        
     def setup_connections(self):
         """设置信号连接"""
         # 标签页切换
         self.tab_widget.currentChanged.connect(self.on_tab_changed)
         
-        # 延迟初始化侧边栏，确保标签页完全创建
-        QTimer.singleShot(100, lambda: self.on_tab_changed(0))
-        
     def apply_dark_theme(self):
-        """应用深色主题"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #0f172a;
-                color: #e5e7eb;
-            }
-            QWidget {
-                background-color: #0f172a;
-                color: #e5e7eb;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 1px solid #1f2937;
-                border-radius: 10px;
-                margin-top: 10px;
-                padding-top: 10px;
-                background-color: #111827;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #38bdf8;
-            }
-            QPushButton {
-                background-color: #0b1220;
-                border: 1px solid #1f2937;
-                border-radius: 8px;
-                padding: 8px 12px;
-                color: #e5e7eb;
-            }
-            QPushButton:hover {
-                background-color: #1f2937;
-            }
-            QPushButton:pressed {
-                background-color: #374151;
-            }
-            QLineEdit, QComboBox {
-                background-color: #0b1220;
-                border: 1px solid #1f2937;
-                border-radius: 8px;
-                padding: 8px 10px;
-                color: #e5e7eb;
-            }
-            QLineEdit:focus, QComboBox:focus {
-                border-color: #38bdf8;
-            }
-            QLabel {
-                color: #9ca3af;
-                font-size: 12px;
-            }
-            QSlider::groove:horizontal {
-                border: 1px solid #1f2937;
-                height: 8px;
-                background: #0b1220;
-                border-radius: 4px;
-            }
-            QSlider::handle:horizontal {
-                background: #38bdf8;
-                border: 1px solid #38bdf8;
-                width: 18px;
-                margin: -5px 0;
-                border-radius: 9px;
-            }
-        """)
+        """应用深色主题（应用级样式表，只解析一次，所有控件共享）"""
+        app = QApplication.instance()
+        if app.property("themeLoaded"):
+            return
+        with open(THEME_QSS, encoding='utf-8') as f:
+            app.setStyleSheet(f.read())
+        app.setProperty("themeLoaded", True)
         
     def on_tab_changed(self, index):
-        """标签页切换事件"""
-        # 预加载所有侧边栏内容（如果还没有加载）
-        if not hasattr(self, '_sidebars_loaded'):
-            self._load_all_sidebars()
-            self._sidebars_loaded = True
-        
-        if index == 0:  # 输入
-            self.sidebar.set_sidebar_content(self.input_tab.get_sidebar_widget())
-        elif index == 1:  # 特征提取
-            self.sidebar.set_sidebar_content(self.extract_tab.get_sidebar_widget())
-        elif index == 2:  # 建模与预测
-            self.sidebar.set_sidebar_content(self.model_tab.get_sidebar_widget())
-        elif index == 3:  # 导出
-            self.sidebar.set_sidebar_content(self.export_tab.get_sidebar_widget())
+        """标签页切换事件：按标签页序号切换侧边栏"""
+        self.sidebar.set_sidebar_content(self._sidebars[index])
     
     def _load_all_sidebars(self):
         """预加载所有侧边栏内容"""
@@ -363,20 +532,11 @@ class FireballAnalysisApp(QMainWindow):
         model_sidebar = self.model_tab.get_sidebar_widget()
         export_sidebar = self.export_tab.get_sidebar_widget()
         
-        # 将所有侧边栏添加到布局中（初始隐藏）
-        layout = QVBoxLayout()
-        layout.addWidget(input_sidebar)
-        layout.addWidget(extract_sidebar)
-        layout.addWidget(model_sidebar)
-        layout.addWidget(export_sidebar)
-        
-        # 隐藏除输入外的所有侧边栏
-        extract_sidebar.hide()
-        model_sidebar.hide()
-        export_sidebar.hide()
+        # 与标签页顺序一致，on_tab_changed 按序号直接查表
+        self._sidebars = [input_sidebar, extract_sidebar, model_sidebar, export_sidebar]
         
-        # 显示输入侧边栏
-        input_sidebar.show()
-        
-        self.sidebar.sidebar_container.setLayout(layout)
-            
+        # 将所有侧边栏放入堆叠容器，默认显示输入侧边栏
+        container = self.sidebar.sidebar_container
+        for sidebar in self._sidebars:
+            container.addWidget(sidebar)
+        container.setCurrentWidget(input_sidebar)
@@ -5,21 +5,81 @@
 """
 
 import numpy as np
+import base64
 import json
 import os
 import glob
+from datetime import datetime, timezone
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                                QPushButton, QLineEdit, QComboBox, QSlider, 
                                QGroupBox, QSplitter, QFileDialog, QMessageBox,
                                QInputDialog)
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer, Signal, QObject, QRunnable, QThreadPool
 from framework import MatplotlibWidget, ImagePreviewWidget
-from fireball_temperature_calculator import FireballTemperatureCalculator
+
+try:
+    import orjson
+except ImportError:
+    # 未安装 orjson 时使用标准库 json 保存
+    orjson = None
+
+
+def _ndarray_to_jsonable(a):
+    """将数组打包为 {dtype, shape, data_b64}，比 JSON 数值列表体积小、编解码快"""
+    a = np.ascontiguousarray(a)
+    return {"dtype": a.dtype.str, "shape": list(a.shape),
+            "data_b64": base64.b64encode(a.tobytes()).decode('ascii')}
+
+
+class SequenceSaverSignals(QObject):
+    """采样序列保存信号（QRunnable 不是 QObject，信号需单独定义）"""
+    finished = Signal(dict)
+
+
+class SequenceSaver(QRunnable):
+    """后台线程中编码并写入采样序列 JSON
+    
+    只做文件写入，不访问界面；结果通过 finished 信号回到 GUI 线程。
+    """
+    
+    def __init__(self, file_path, sequence_data):
+        super().__init__()
+        self.file_path = file_path
+        self.sequence_data = sequence_data
+        self.signals = SequenceSaverSignals()
+        
+    def run(self):
+        result = {'file_path': self.file_path, 'error': None}
+        try:
+            # orjson 直接输出 UTF-8 字节，一次写入
+            if orjson is not None:
+                with open(self.file_path, 'wb') as f:
+                    f.write(orjson.dumps(self.sequence_data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(self.file_path, 'w', encoding='utf-8') as f:
+                    json.dump(self.sequence_data, f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            result['error'] = str(e)
+        self.signals.finished.emit(result)
 
 
 class InputTab(QWidget):
     """输入模块标签页"""
     
+    # 参数表单变化（防抖后只发一次），携带完整参数字典
+    parameters_changed = Signal(dict)
+    
+    EXPLOSIVE_TYPES = ("TNT", "Polyurethane", "30% Al / Rubber",
+                       "40% Al / Rubber", "50% Al / Rubber", "60% Al / Rubber")
+    
+    # 文件对话框过滤器
+    VIDEO_FILTER = "视频文件 (*.mp4 *.avi *.mov *.mkv *.wmv *.flv);;所有文件 (*)"
+    TEMPERATURE_FILTER = "CSV文件 (*.csv);;JSON文件 (*.json);;文本文件 (*.txt);;所有文件 (*)"
+    SEQUENCE_FILTER = "JSON文件 (*.json);;所有文件 (*)"
+    
+    # 默认温度曲线缓存（所有实例共享）：(模式, 过渡宽度 ms, 点数, 终止时间 ms) -> (t_ms, T_K)
+    _temperature_curves = {}
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         # 初始化文件路径属性
@@ -28,6 +88,24 @@ class InputTab(QWidget):
         self.temperature_file_path = None  # 温度文件路径
         self.image_files = []  # 存储图像文件列表
         self.current_image_index = 0  # 当前显示的图像索引
+        # 已解析的爆炸时长（ms），输入无效时为 None；只在输入变化时解析一次
+        self._duration_ms = 140
+        self._time_labels = []  # 各帧的时间标签（加载序列或时长变化时预先生成）
+        # 右侧参数面板当前显示的原始参数值，保存序列时直接使用，不再解析标签文本
+        self._params = {
+            "material_type": "40% Al / Rubber", "equivalent": "10", "al_percent": "30",
+            "env_temp": "24", "env_humidity": "48", "env_pressure": "2987.87",
+            "explosion_duration": "140", "pixel_length": "0.01",
+        }
+        # 参数输入防抖：连续输入时只在停顿 150ms 后更新一次参数显示
+        self._param_timer = QTimer(self)
+        self._param_timer.setSingleShot(True)
+        self._param_timer.setInterval(150)
+        self._param_timer.timeout.connect(self._apply_parameter_change)
+        # 温度图表在标签页首次显示时才初始化
+        self._chart_ready = False
+        # 温度图表当前显示的曲线 (t_ms, T_K)，保存采样序列时一并写入
+        self._temperature_curve = None
         self.init_ui()
         self.setup_connections()
         
@@ -40,22 +118,6 @@ class InputTab(QWidget):
         
         # 图像预览、时间轴和温度图表组合
         preview_group = QGroupBox("爆炸流程预览")
-        preview_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 1px solid #1f2937;
-                border-radius: 10px;
-                margin-top: 10px;
-                padding-top: 10px;
-                background-color: #111827;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #38bdf8;
-            }
-        """)
         preview_layout = QVBoxLayout()
         preview_layout.setAlignment(Qt.AlignTop)
         preview_layout.setSpacing(8)  # 设置组件间距
@@ -69,7 +131,6 @@ class InputTab(QWidget):
         self.time_slider = QSlider(Qt.Horizontal)
         self.time_slider.setRange(0, 100)
         self.time_label = QLabel("t = 0 ms")
-        self.time_label.setStyleSheet("color: #9ca3af; font-size: 12px;")
         timeline_layout.addWidget(self.time_slider)
         timeline_layout.addWidget(self.time_label)
         preview_layout.addLayout(timeline_layout)
@@ -91,22 +152,6 @@ class InputTab(QWidget):
         
         # 材料与环境参数（只读显示）
         params_group = QGroupBox("材料与环境")
-        params_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 1px solid #1f2937;
-                border-radius: 10px;
-                margin-top: 10px;
-                padding-top: 10px;
-                background-color: #111827;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #38bdf8;
-            }
-        """)
         params_layout = QVBoxLayout()
         params_layout.setSpacing(2)  # 减少标签间距
         params_layout.setContentsMargins(10, 15, 10, 10)
@@ -120,50 +165,18 @@ class InputTab(QWidget):
         self.env_humidity_label = QLabel("相对湿度: 48%")
         self.env_pressure_label = QLabel("水饱和气压: 2987.87 Pa")
         
-        # 设置标签样式，参考HTML设计
-        label_style = """
-            QLabel {
-                color: #9ca3af;
-                font-size: 12px;
-                padding: 2px 0px;
-                margin: 0px;
-            }
-        """
-        self.material_label.setStyleSheet(label_style)
-        self.equivalent_label.setStyleSheet(label_style)
-        self.al_percent_label.setStyleSheet(label_style)
-        self.env_temp_label.setStyleSheet(label_style)
-        self.env_humidity_label.setStyleSheet(label_style)
-        self.env_pressure_label.setStyleSheet(label_style)
-        
-        params_layout.addWidget(self.material_label)
-        params_layout.addWidget(self.equivalent_label)
-        params_layout.addWidget(self.al_percent_label)
-        params_layout.addWidget(self.env_temp_label)
-        params_layout.addWidget(self.env_humidity_label)
-        params_layout.addWidget(self.env_pressure_label)
+        # 样式由 theme.qss 中的 QLabel[class="param"] 统一设置
+        for label in (self.material_label, self.equivalent_label, self.al_percent_label,
+                      self.env_temp_label, self.env_humidity_label, self.env_pressure_label):
+            label.setProperty("class", "param")
+            params_layout.addWidget(label)
         
         params_group.setLayout(params_layout)
         right_layout.addWidget(params_group)
         
         # 保存采样序列按钮
         self.save_sequence_btn = QPushButton("保存采样序列")
-        self.save_sequence_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #0b1220;
-                border: 1px solid #1f2937;
-                border-radius: 8px;
-                padding: 8px 12px;
-                color: #e5e7eb;
-                font-size: 13px;
-            }
-            QPushButton:hover {
-                background-color: #1f2937;
-            }
-            QPushButton:pressed {
-                background-color: #374151;
-            }
-        """)
+        self.save_sequence_btn.setObjectName("SaveSequenceButton")
         right_layout.addWidget(self.save_sequence_btn)
         
         right_widget.setLayout(right_layout)
@@ -177,34 +190,80 @@ class InputTab(QWidget):
         layout.addWidget(splitter)
         self.setLayout(layout)
         
-        # 初始化图表（不绘制曲线）
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.init_charts()
+        
+    def init_charts(self):
+        """初始化图表（只执行一次）"""
+        if self._chart_ready:
+            return
+        self._chart_ready = True
         self.init_temperature_chart()
         
     def setup_connections(self):
         """设置信号连接"""
-        self.time_slider.valueChanged.connect(self.on_time_changed)
+        # 时间轴刷新定时器：键盘/滚轮改变时限频（约30Hz），拖动时用作停顿检测
+        self._slider_timer = QTimer(self)
+        self._slider_timer.setSingleShot(True)
+        self._slider_timer.setInterval(33)
+        self._slider_timer.timeout.connect(self._redraw_preview)
+        self.time_slider.valueChanged.connect(self.on_slider_value_changed)
+        # 拖动时只更新时间标签，停顿或松开后才显示图像
+        self.time_slider.sliderMoved.connect(self.on_slider_moved)
+        self.time_slider.sliderReleased.connect(self.on_slider_released)
         self.save_sequence_btn.clicked.connect(self.save_sequence)
+        self.parameters_changed.connect(
+            lambda params: self.update_parameters_display(**params))
+        
+    def on_slider_value_changed(self, value):
+        """时间轴数值变化（键盘、滚轮或程序设置），合并到下一次定时刷新"""
+        if self.time_slider.isSliderDown():
+            return  # 拖动中由 on_slider_moved 处理
+        if not self._slider_timer.isActive():
+            self._slider_timer.start()
+    
+    def on_slider_moved(self, value):
+        """拖动时间轴：立即更新时间标签，每次移动重新计时，停顿后再显示图像"""
+        self._update_time_label(value)
+        self._slider_timer.start()
+    
+    def on_slider_released(self):
+        """松开时间轴后立即显示当前帧"""
+        self._slider_timer.stop()
+        self._redraw_preview()
+    
+    def _redraw_preview(self):
+        """按时间轴当前值刷新预览"""
+        self.on_time_changed(self.time_slider.value())
         
     def on_time_changed(self, value):
         """时间轴变化"""
-        # 更新标签显示
+        self._update_time_label(value)
         if self.image_files:
-            # 计算实际时间（毫秒）
-            try:
-                duration = int(self.explosion_duration.text())
-                total_frames = len(self.image_files)
-                if total_frames > 1:
-                    time_ms = (value / (total_frames - 1)) * duration
-                else:
-                    time_ms = 0
-                self.time_label.setText(f"t = {time_ms:.1f} ms (帧 {value + 1}/{total_frames})")
-            except ValueError:
-                self.time_label.setText(f"帧 {value + 1}/{len(self.image_files)}")
-            
             # 显示对应的图像
             self.display_image_at_index(value)
+    
+    def _update_time_label(self, value):
+        """按预先生成的标签显示当前时间"""
+        if self.image_files:
+            self.time_label.setText(self._time_labels[value])
         else:
             self.time_label.setText(f"t = {value} ms")
+    
+    def _build_time_labels(self):
+        """按图像帧数和爆炸时长预先生成各帧的时间标签"""
+        duration = self._duration_ms
+        total_frames = len(self.image_files)
+        if duration is None:
+            self._time_labels = [f"帧 {i + 1}/{total_frames}" for i in range(total_frames)]
+            return
+        labels = []
+        for i in range(total_frames):
+            # 计算实际时间（毫秒）
+            time_ms = (i / (total_frames - 1)) * duration if total_frames > 1 else 0
+            labels.append(f"t = {time_ms:.1f} ms (帧 {i + 1}/{total_frames})")
+        self._time_labels = labels
         
     def display_image_at_index(self, index):
         """显示指定索引的图像"""
@@ -262,8 +321,8 @@ class InputTab(QWidget):
             # 调整布局，确保标签完全显示
             self.temp_chart.figure.tight_layout(pad=1.5)
             
-            # 刷新显示
-            self.temp_chart.canvas.draw()
+            # 刷新显示（与窗口的下一次绘制合并）
+            self.temp_chart.canvas.draw_idle()
             
         except Exception as e:
             print(f"初始化温度图表失败: {e}")
@@ -272,10 +331,13 @@ class InputTab(QWidget):
         """更新温度图表（绘制曲线）"""
         try:
             print(f"update_temperature_chart 被调用: time_data={time_data is not None}, temp_data={temp_data is not None}")
+            # 曲线会替换整个图表，不再需要显示时初始化占位图
+            self._chart_ready = True
             
             if time_data is not None and temp_data is not None:
                 # 使用导入的数据绘制曲线
                 print(f"绘制导入的数据曲线: {len(time_data)} 个点")
+                self._temperature_curve = (time_data, temp_data)
                 self.temp_chart.plot_line(
                     time_data, temp_data,
                     title="爆炸温度变化",
@@ -286,9 +348,8 @@ class InputTab(QWidget):
             else:
                 # 使用默认计算数据绘制曲线
                 print("绘制默认计算数据曲线")
-                t_ms = np.linspace(0, 140, 800)
-                temp_calc = FireballTemperatureCalculator(mode='blend', blend_width_ms=12.0)
-                T_K = temp_calc.temperature_modified(t_ms)
+                t_ms, T_K = self.default_temperature_curve()
+                self._temperature_curve = (t_ms, T_K)
                 self.temp_chart.plot_line(
                     t_ms, T_K,
                     title="爆炸温度变化",
@@ -304,10 +365,34 @@ class InputTab(QWidget):
             import traceback
             traceback.print_exc()
     
+    @classmethod
+    def default_temperature_curve(cls, mode='blend', blend_width_ms=12.0, n_points=800, t_max_ms=140.0):
+        """默认温度曲线，相同参数只计算一次（计算器构造时的参数拟合开销较大）"""
+        key = (mode, blend_width_ms, n_points, t_max_ms)
+        curve = cls._temperature_curves.get(key)
+        if curve is None:
+            from fireball_temperature_calculator import FireballTemperatureCalculator
+            t_ms = np.linspace(0, t_max_ms, n_points)
+            temp_calc = FireballTemperatureCalculator.shared(mode=mode, blend_width_ms=blend_width_ms)
+            curve = (t_ms, temp_calc.temperature_modified(t_ms))
+            # 缓存数组由所有实例共享，设为只读防止被意外修改
+            for arr in curve:
+                arr.setflags(write=False)
+            cls._temperature_curves[key] = curve
+        return curve
+    
     def update_parameters_display(self, material_type="40% Al / Rubber", equivalent="10", 
                                  al_percent="30", env_temp="24", env_humidity="48", 
                                  env_pressure="2987.87", explosion_duration="140", pixel_length="0.01"):
-        """更新右侧参数显示"""
+        """更新右侧参数显示（参数与当前显示相同时直接返回）"""
+        params = {
+            "material_type": material_type, "equivalent": equivalent, "al_percent": al_percent,
+            "env_temp": env_temp, "env_humidity": env_humidity, "env_pressure": env_pressure,
+            "explosion_duration": explosion_duration, "pixel_length": pixel_length,
+        }
+        if params == self._params:
+            return
+        self._params = params
         self.material_label.setText(f"炸药类别: {material_type}")
         self.equivalent_label.setText(f"当量: {equivalent} kg TNT")
         self.al_percent_label.setText(f"含铝量: {al_percent}%")
@@ -321,55 +406,79 @@ class InputTab(QWidget):
         try:
             # 获取保存路径
             file_path, _ = QFileDialog.getSaveFileName(
-                self, "保存采样序列", "fireball_sequence.json", 
-                "JSON文件 (*.json);;所有文件 (*)"
+                self, "保存采样序列", "fireball_sequence.json", self.SEQUENCE_FILTER
             )
             
             if not file_path:
                 return
             
+            # 防抖中的参数修改立即生效，避免保存到旧参数
+            if self._param_timer.isActive():
+                self._param_timer.stop()
+                self._apply_parameter_change()
+            
+            # 温度曲线：保存图表当前显示的曲线（以 float32 打包）；未导入时图表只有占位提示，不保存曲线
+            temperature_data = {"note": "未导入温度数据"}
+            if self._temperature_curve is not None:
+                t_ms, T_K = self._temperature_curve
+                t_ms = np.asarray(t_ms, dtype=np.float32)
+                T_K = np.asarray(T_K, dtype=np.float32)
+                temperature_data = {
+                    "time_range": f"{t_ms[0]:g}-{t_ms[-1]:g} ms",
+                    "data_points": len(t_ms),
+                    "note": "图表当前显示的温度曲线",
+                    "t_ms": _ndarray_to_jsonable(t_ms),
+                    "T_K": _ndarray_to_jsonable(T_K)
+                }
+            
             # 准备保存的数据
             sequence_data = {
                 "metadata": {
                     "description": "爆炸火球分析采样序列",
                     "version": "1.0",
-                    "created_at": str(np.datetime64('now'))
+                    "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds")
                 },
                 "parameters": {
-                    "material_type": self.material_label.text().split(": ")[1],
-                    "equivalent": self.equivalent_label.text().split(": ")[1].split(" ")[0],
-                    "al_percent": self.al_percent_label.text().split(": ")[1].replace("%", ""),
-                    "env_temp": self.env_temp_label.text().split(": ")[1].replace("°C", ""),
-                    "env_humidity": self.env_humidity_label.text().split(": ")[1].replace("%", ""),
-                    "env_pressure": self.env_pressure_label.text().split(": ")[1].replace(" Pa", ""),
-                    "explosion_duration": self.explosion_duration.text(),
-                    "pixel_length": self.pixel_length.text()
+                    "material_type": self._params["material_type"],
+                    "equivalent": self._params["equivalent"],
+                    "al_percent": self._params["al_percent"],
+                    "env_temp": self._params["env_temp"],
+                    "env_humidity": self._params["env_humidity"],
+                    "env_pressure": self._params["env_pressure"],
+                    "explosion_duration": self._params["explosion_duration"],
+                    "pixel_length": self._params["pixel_length"]
                 },
                 "files": {
                     "image_folder": self.image_folder_path if self.image_folder_path else "未设置",
                     "video_file": self.video_file_path if self.video_file_path else "未设置",
                     "temperature_file": getattr(self, 'temperature_file_path', "未设置")
                 },
-                "temperature_data": {
-                    "time_range": "0-140 ms",
-                    "data_points": 800,
-                    "note": "温度数据基于当前参数计算"
-                },
+                "temperature_data": temperature_data,
                 "image_sequence_info": {
                     "folder_path": self.image_folder_path if self.image_folder_path else "未设置",
                     "note": "图像序列文件夹路径"
                 }
             }
             
-            # 保存到文件
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(sequence_data, f, ensure_ascii=False, indent=2)
-            
-            QMessageBox.information(self, "保存成功", f"采样序列已保存到:\n{file_path}")
+            # 编码和写文件放到线程池，完成后由 _on_sequence_saved 提示结果
+            self.save_sequence_btn.setEnabled(False)
+            self.save_sequence_btn.setText("正在保存…")
+            self._sequence_saver = SequenceSaver(file_path, sequence_data)
+            self._sequence_saver.signals.finished.connect(self._on_sequence_saved)
+            QThreadPool.globalInstance().start(self._sequence_saver)
             
         except Exception as e:
             QMessageBox.critical(self, "保存失败", f"保存采样序列时出错:\n{str(e)}")
     
+    def _on_sequence_saved(self, result):
+        """采样序列写入完成"""
+        self.save_sequence_btn.setText("保存采样序列")
+        self.save_sequence_btn.setEnabled(True)
+        if result['error'] is None:
+            QMessageBox.information(self, "保存成功", f"采样序列已保存到:\n{result['file_path']}")
+        else:
+            QMessageBox.critical(self, "保存失败", f"保存采样序列时出错:\n{result['error']}")
+    
     
     def get_sidebar_widget(self):
         """获取输入模块的侧边栏组件"""
@@ -389,8 +498,7 @@ class InputTab(QWidget):
             
             # 参数组控件
             self.explosive_type = QComboBox()
-            self.explosive_type.addItems(["TNT", "Polyurethane", "30% Al / Rubber", 
-                                        "40% Al / Rubber", "50% Al / Rubber", "60% Al / Rubber"])
+            self.explosive_type.addItems(self.EXPLOSIVE_TYPES)
             self.explosive_type.setCurrentText("40% Al / Rubber")
             
             # 当量和含铝量
@@ -405,53 +513,27 @@ class InputTab(QWidget):
             # 控制按钮
             self.clear_btn = QPushButton("清空输入")
             self.input_status = QLabel("等待文件导入…")
-            self.input_status.setStyleSheet("color: #9ca3af; font-size: 12px;")
             
             # 文件输入组
             file_group = QGroupBox("文件输入")
-            file_group.setStyleSheet("""
-                QGroupBox {
-                    font-weight: bold;
-                    border: 1px solid #374151;
-                    border-radius: 8px;
-                    margin-top: 10px;
-                    padding-top: 10px;
-                    background-color: #1f2937;
-                }
-                QGroupBox::title {
-                    subcontrol-origin: margin;
-                    left: 10px;
-                    padding: 0 5px 0 5px;
-                    color: #60a5fa;
-                }
-            """)
+            file_group.setProperty("class", "sidebar")
             file_layout = QVBoxLayout()
             file_layout.setAlignment(Qt.AlignTop)
             file_layout.setContentsMargins(10, 10, 10, 10)
             
-            # 创建标签样式
-            label_style = """
-                QLabel {
-                    background-color: transparent;
-                    color: #e5e7eb;
-                    font-size: 12px;
-                    padding: 2px 0px;
-                }
-            """
-            
             # 文件输入标签
             image_seq_label = QLabel("导入火球图像序列")
-            image_seq_label.setStyleSheet(label_style)
+            image_seq_label.setProperty("class", "field")
             file_layout.addWidget(image_seq_label)
             file_layout.addWidget(self.image_sequence_btn)
             
             video_label = QLabel("导入火球视频文件")
-            video_label.setStyleSheet(label_style)
+            video_label.setProperty("class", "field")
             file_layout.addWidget(video_label)
             file_layout.addWidget(self.video_file_btn)
             
             temp_label = QLabel("导入火球温度时间序列（CSV/JSON）")
-            temp_label.setStyleSheet(label_style)
+            temp_label.setProperty("class", "field")
             file_layout.addWidget(temp_label)
             file_layout.addWidget(self.temp_files_btn)
             
@@ -459,7 +541,7 @@ class InputTab(QWidget):
             duration_layout = QHBoxLayout()
             duration_layout.setAlignment(Qt.AlignTop)
             duration_label = QLabel("爆炸时长(ms):")
-            duration_label.setStyleSheet(label_style)
+            duration_label.setProperty("class", "field")
             duration_layout.addWidget(duration_label)
             duration_layout.addWidget(self.explosion_duration)
             file_layout.addLayout(duration_layout)
@@ -467,7 +549,7 @@ class InputTab(QWidget):
             pixel_layout = QHBoxLayout()
             pixel_layout.setAlignment(Qt.AlignTop)
             pixel_label = QLabel("像素长度(m):")
-            pixel_label.setStyleSheet(label_style)
+            pixel_label.setProperty("class", "field")
             pixel_layout.addWidget(pixel_label)
             pixel_layout.addWidget(self.pixel_length)
             file_layout.addLayout(pixel_layout)
@@ -477,66 +559,41 @@ class InputTab(QWidget):
             
             # 参数组
             param_group = QGroupBox("参数设置")
-            param_group.setStyleSheet("""
-                QGroupBox {
-                    font-weight: bold;
-                    border: 1px solid #374151;
-                    border-radius: 8px;
-                    margin-top: 10px;
-                    padding-top: 10px;
-                    background-color: #1f2937;
-                }
-                QGroupBox::title {
-                    subcontrol-origin: margin;
-                    left: 10px;
-                    padding: 0 5px 0 5px;
-                    color: #60a5fa;
-                }
-            """)
+            param_group.setProperty("class", "sidebar")
             param_layout = QVBoxLayout()
             param_layout.setAlignment(Qt.AlignTop)
             param_layout.setContentsMargins(10, 10, 10, 10)
             
-            # 参数组标签样式（与文件组相同）
-            param_label_style = """
-                QLabel {
-                    background-color: transparent;
-                    color: #e5e7eb;
-                    font-size: 12px;
-                    padding: 2px 0px;
-                }
-            """
-            
             # 炸药参数
             explosive_label = QLabel("炸药类别")
-            explosive_label.setStyleSheet(param_label_style)
+            explosive_label.setProperty("class", "field")
             param_layout.addWidget(explosive_label)
             param_layout.addWidget(self.explosive_type)
             
             # 当量和含铝量
             equivalent_label = QLabel("当量（kg TNT）")
-            equivalent_label.setStyleSheet(param_label_style)
+            equivalent_label.setProperty("class", "field")
             param_layout.addWidget(equivalent_label)
             param_layout.addWidget(self.equivalent)
             
             al_percent_label = QLabel("含铝量（%）")
-            al_percent_label.setStyleSheet(param_label_style)
+            al_percent_label.setProperty("class", "field")
             param_layout.addWidget(al_percent_label)
             param_layout.addWidget(self.al_percent)
             
             # 环境参数
             env_temp_label = QLabel("环境温度 Ta（°C）")
-            env_temp_label.setStyleSheet(param_label_style)
+            env_temp_label.setProperty("class", "field")
             param_layout.addWidget(env_temp_label)
             param_layout.addWidget(self.env_temp)
             
             env_humidity_label = QLabel("相对湿度 RH（%）")
-            env_humidity_label.setStyleSheet(param_label_style)
+            env_humidity_label.setProperty("class", "field")
             param_layout.addWidget(env_humidity_label)
             param_layout.addWidget(self.env_humidity)
             
             env_pressure_label = QLabel("水饱和气压 PwSat(Ta)（Pa）")
-            env_pressure_label.setStyleSheet(param_label_style)
+            env_pressure_label.setProperty("class", "field")
             param_layout.addWidget(env_pressure_label)
             param_layout.addWidget(self.env_pressure)
             
@@ -582,7 +639,8 @@ class InputTab(QWidget):
         """选择图像序列文件夹"""
         # 选择文件夹
         folder_path = QFileDialog.getExistingDirectory(
-            self, "选择图像序列文件夹", ""
+            self, "选择图像序列文件夹", "",
+            QFileDialog.ShowDirsOnly | QFileDialog.ReadOnly
         )
         
         if folder_path:
@@ -605,12 +663,10 @@ class InputTab(QWidget):
                 self.image_files = image_files
                 self.image_folder_path = folder_path
                 self.current_image_index = 0
+                self._build_time_labels()
                 
                 # 获取爆炸时长
-                try:
-                    duration = int(self.explosion_duration.text())
-                except ValueError:
-                    duration = 140  # 默认值
+                duration = self._duration_ms if self._duration_ms is not None else 140  # 默认值
                 
                 # 设置时间轴范围
                 self.time_slider.setRange(0, len(image_files) - 1)
@@ -626,8 +682,8 @@ class InputTab(QWidget):
     def select_video_file(self):
         """选择视频文件"""
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "选择视频文件",
-            "", "视频文件 (*.mp4 *.avi *.mov *.mkv *.wmv *.flv);;所有文件 (*)"
+            self, "选择视频文件", "", self.VIDEO_FILTER,
+            options=QFileDialog.ReadOnly
         )
         
         if file_path:
@@ -639,8 +695,8 @@ class InputTab(QWidget):
     def select_temp_files(self):
         """选择温度时间序列文件"""
         files, _ = QFileDialog.getOpenFileNames(
-            self, "选择火球温度时间序列文件",
-            "", "CSV文件 (*.csv);;JSON文件 (*.json);;文本文件 (*.txt);;所有文件 (*)"
+            self, "选择火球温度时间序列文件", "", self.TEMPERATURE_FILTER,
+            options=QFileDialog.ReadOnly
         )
         if files:
             try:
@@ -785,6 +841,7 @@ class InputTab(QWidget):
         self.video_file_path = None
         self.temperature_file_path = None
         self.image_files = []
+        self._time_labels = []
         self.current_image_index = 0
         
         # 重置时间轴
@@ -796,25 +853,34 @@ class InputTab(QWidget):
         self.image_preview.clear()
         
         # 重新初始化温度图表
+        self._temperature_curve = None
         self.init_temperature_chart()
     
     def on_duration_changed(self):
         """爆炸时长变化时的回调"""
+        try:
+            self._duration_ms = int(self.explosion_duration.text())
+        except ValueError:
+            self._duration_ms = None
         if self.image_files:
-            # 重新计算当前时间显示
+            # 重新生成时间标签并刷新当前时间显示
+            self._build_time_labels()
             current_value = self.time_slider.value()
             self.on_time_changed(current_value)
     
     def on_parameter_changed(self):
-        """参数变化时的回调"""
-        # 更新右侧参数显示
-        self.update_parameters_display(
-            self.explosive_type.currentText(),
-            self.equivalent.text(),
-            self.al_percent.text(),
-            self.env_temp.text(),
-            self.env_humidity.text(),
-            self.env_pressure.text(),
-            self.explosion_duration.text(),
-            self.pixel_length.text()
-        )
+        """参数变化时的回调（重新计时，停止输入后才更新）"""
+        self._param_timer.start()
+    
+    def _apply_parameter_change(self):
+        """参数输入停顿后汇总表单，只发出一次 parameters_changed"""
+        self.parameters_changed.emit({
+            "material_type": self.explosive_type.currentText(),
+            "equivalent": self.equivalent.text(),
+            "al_percent": self.al_percent.text(),
+            "env_temp": self.env_temp.text(),
+            "env_humidity": self.env_humidity.text(),
+            "env_pressure": self.env_pressure.text(),
+            "explosion_duration": self.explosion_duration.text(),
+            "pixel_length": self.pixel_length.text(),
+        })
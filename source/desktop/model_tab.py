@@ -7,17 +7,68 @@
 import numpy as np
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                                QGridLayout, QPushButton, QComboBox, QLineEdit, QGroupBox)
+from PySide6.QtCore import QObject, Signal, QRunnable, QThreadPool
 from framework import MatplotlibWidget
-from fireball_radius_calculator import FireballCalculator
-from fireball_temperature_calculator import FireballTemperatureCalculator
-from transmissivity_calculator import TransmissivityParams
-from fireball_heat_radiation_calculator import (compute_heat_flux_over_time,
-                                               integrate_heat_radiation)
+
+
+class PredictionSignals(QObject):
+    """预测计算信号（QRunnable 不是 QObject，信号需单独定义）"""
+    finished = Signal(dict)
+
+
+class PredictionWorker(QRunnable):
+    """后台线程中计算示例预测曲线
+    
+    只做数值计算，不访问界面；已算出的曲线逐项放入结果，出错时也一并返回。
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self.signals = PredictionSignals()
+        
+    def run(self):
+        # 计算模块首次建模时才导入，不拖慢程序启动
+        from fireball_radius_calculator import FireballCalculator
+        from fireball_temperature_calculator import FireballTemperatureCalculator
+        from transmissivity_calculator import TransmissivityParams
+        from fireball_heat_radiation_calculator import (compute_heat_flux_over_time,
+                                                       compute_H_for_distances)
+        result = {'error': None}
+        try:
+            # 火球直径随时间变化
+            t_ms = np.linspace(0, 140, 800)
+            result['t_ms'] = t_ms
+            radius_calc = FireballCalculator()
+            t_s = t_ms / 1000.0
+            D_m = radius_calc.calculate_diameter(t_s, '40%Al/Rubber')
+            result['D_m'] = D_m
+            
+            # 火球温度随时间变化
+            temp_calc = FireballTemperatureCalculator.shared(mode='blend', blend_width_ms=12.0)
+            T_K = temp_calc.temperature_modified(t_ms)
+            result['T_K'] = T_K
+            
+            # 热通量随时间变化 (不同距离)，各距离共用时间轴，每行一个距离
+            distances = [4.0, 4.5, 5.0, 5.5, 6.0]
+            result['heat_flux'] = compute_heat_flux_over_time(
+                np.array(distances), t_ms, T_K, D_m, TransmissivityParams())
+            result['distances'] = distances
+            
+            # 累积热辐射量随距离分布
+            x_values = np.linspace(4.0, 6.0, 50)
+            H_values = compute_H_for_distances(x_values, t_ms, T_K, D_m, TransmissivityParams())
+            result['x_values'] = x_values
+            result['H_values'] = H_values
+        except Exception as e:
+            result['error'] = str(e)
+        self.signals.finished.emit(result)
 
 
 class ModelTab(QWidget):
     """建模与预测模块标签页"""
     
+    ALGORITHMS = ("工程进算法", "T-Transformer")
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.init_ui()
@@ -30,7 +81,6 @@ class ModelTab(QWidget):
         toolbar.addWidget(QLabel("仿真预测结果"))
         toolbar.addStretch()
         self.modeling_status = QLabel("未开始")
-        self.modeling_status.setStyleSheet("color: #9ca3af; font-size: 12px;")
         toolbar.addWidget(self.modeling_status)
         layout.addLayout(toolbar)
         
@@ -60,70 +110,68 @@ class ModelTab(QWidget):
         self.setLayout(layout)
         
     def update_prediction_charts(self):
-        """更新预测图表"""
+        """更新预测图表（曲线在线程池中计算，完成后由 _on_prediction_ready 绘制）"""
+        self.modeling_status.setText("正在计算预测曲线...")
+        self._prediction_worker = PredictionWorker()
+        self._prediction_worker.signals.finished.connect(self._on_prediction_ready)
+        QThreadPool.globalInstance().start(self._prediction_worker)
+        
+    def _on_prediction_ready(self, result):
+        """绘制已算好的预测曲线；计算中途出错时保留已完成的部分"""
+        t_ms = result.get('t_ms')
+        # 四个图表更新完成后再统一重绘，避免逐个图表触发重绘
+        self.setUpdatesEnabled(False)
         try:
             # 火球直径随时间变化
-            t_ms = np.linspace(0, 140, 800)
-            radius_calc = FireballCalculator()
-            t_s = t_ms / 1000.0
-            D_m = radius_calc.calculate_diameter(t_s, '40%Al/Rubber')
-            
-            self.diam_chart.plot_line(
-                t_ms, D_m,
-                title="火球直径随时间变化",
-                xlabel="时间 (ms)",
-                ylabel="直径 (m)",
-                color='#22d3ee'
-            )
+            if 'D_m' in result:
+                self.diam_chart.plot_line(
+                    t_ms, result['D_m'],
+                    title="火球直径随时间变化",
+                    xlabel="时间 (ms)",
+                    ylabel="直径 (m)",
+                    color='#22d3ee'
+                )
             
             # 火球温度随时间变化
-            temp_calc = FireballTemperatureCalculator(mode='blend', blend_width_ms=12.0)
-            T_K = temp_calc.temperature_modified(t_ms)
-            
-            self.temp_chart.plot_line(
-                t_ms, T_K,
-                title="火球温度随时间变化",
-                xlabel="时间 (ms)",
-                ylabel="温度 (K)",
-                color='#38bdf8'
-            )
+            if 'T_K' in result:
+                self.temp_chart.plot_line(
+                    t_ms, result['T_K'],
+                    title="火球温度随时间变化",
+                    xlabel="时间 (ms)",
+                    ylabel="温度 (K)",
+                    color='#38bdf8'
+                )
             
             # 热通量随时间变化 (不同距离)
-            distances = [4.0, 4.5, 5.0, 5.5, 6.0]
-            heat_flux_data = {}
-            
-            for dist in distances:
-                q_t = compute_heat_flux_over_time(dist, t_ms, T_K, D_m, TransmissivityParams())
-                heat_flux_data[f'x = {dist:.1f} m'] = (t_ms, q_t)
-            
-            self.heat_flux_chart.plot_multiple_lines(
-                heat_flux_data,
-                title="热通量随时间变化 (不同距离)",
-                xlabel="时间 (ms)",
-                ylabel="热通量 (W/m²)"
-            )
+            if 'heat_flux' in result:
+                self.heat_flux_chart.plot_matrix(
+                    t_ms, result['heat_flux'],
+                    [f'x = {dist:.1f} m' for dist in result['distances']],
+                    title="热通量随时间变化 (不同距离)",
+                    xlabel="时间 (ms)",
+                    ylabel="热通量 (W/m²)"
+                )
             
             # 累积热辐射量随距离分布
-            x_values = np.linspace(4.0, 6.0, 50)
-            H_values = []
-            
-            for x in x_values:
-                q_t = compute_heat_flux_over_time(x, t_ms, T_K, D_m, TransmissivityParams())
-                H = integrate_heat_radiation(q_t, t_ms)
-                H_values.append(H)
-            
-            self.heat_radiation_chart.plot_line(
-                x_values, H_values,
-                title="累积热辐射量随距离分布",
-                xlabel="距离 (m)",
-                ylabel="热辐射量 (J/m²)",
-                color='#10b981'
-            )
-            
-            self.modeling_status.setText("已生成示例预测曲线")
+            if 'H_values' in result:
+                self.heat_radiation_chart.plot_line(
+                    result['x_values'], result['H_values'],
+                    title="累积热辐射量随距离分布",
+                    xlabel="距离 (m)",
+                    ylabel="热辐射量 (J/m²)",
+                    color='#10b981'
+                )
+            
+            if result['error'] is None:
+                self.modeling_status.setText("已生成示例预测曲线")
+            else:
+                print(f"更新预测图表失败: {result['error']}")
+                self.modeling_status.setText("预测曲线计算失败")
             
         except Exception as e:
             print(f"更新预测图表失败: {e}")
+        finally:
+            self.setUpdatesEnabled(True)
     
     def get_sidebar_widget(self):
         """获取建模与预测模块的侧边栏组件"""
@@ -143,7 +191,7 @@ class ModelTab(QWidget):
             
             layout.addWidget(QLabel("算法"))
             self.algo = QComboBox()
-            self.algo.addItems(["工程进算法", "T-Transformer"])
+            self.algo.addItems(self.ALGORITHMS)
             layout.addWidget(self.algo)
             
             # 学习率和轮次
@@ -157,7 +205,7 @@ class ModelTab(QWidget):
             layout.addLayout(lr_layout)
             
             self.train_btn = QPushButton("开始训练")
-            self.train_btn.setStyleSheet("QPushButton { background-color: #0ea5e9; color: white; }")
+            self.train_btn.setProperty("class", "primary")
             layout.addWidget(self.train_btn)
             
             # 预测部分
@@ -187,7 +235,7 @@ class ModelTab(QWidget):
             layout.addLayout(sim_layout)
             
             self.predict_btn = QPushButton("开始预测")
-            self.predict_btn.setStyleSheet("QPushButton { background-color: #10b981; color: white; }")
+            self.predict_btn.setProperty("class", "success")
             layout.addWidget(self.predict_btn)
             
             self._sidebar_widget.setLayout(layout)
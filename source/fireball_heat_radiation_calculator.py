@@ -34,9 +34,12 @@ from transmissivity_calculator import TransmissivityParams, transmissivity
 EPSILON = 0.9
 SIGMA = 5.67e-8  # W/(m^2*K^4)
 
+# np.trapz was renamed to np.trapezoid in NumPy 2.0 (and later removed)
+_trapezoid = getattr(np, 'trapezoid', None) or np.trapz
+
 
 def compute_temperature_profile(t_ms: np.ndarray) -> np.ndarray:
-    temp_calc = FireballTemperatureCalculator(mode='blend', blend_width_ms=12.0)
+    temp_calc = FireballTemperatureCalculator.shared(mode='blend', blend_width_ms=12.0)
     T_K = temp_calc.temperature_modified(t_ms)
     return T_K
 
@@ -48,22 +51,42 @@ def compute_diameter_profile(t_ms: np.ndarray, material: str = '40%Al/Rubber') -
     return D_m
 
 
-def compute_heat_flux_over_time(x_m: float, t_ms: np.ndarray, T_K: np.ndarray, D_m: np.ndarray,
+def compute_heat_flux_over_time(x_m: float | np.ndarray, t_ms: np.ndarray, T_K: np.ndarray, D_m: np.ndarray,
                                  trans_params: TransmissivityParams = TransmissivityParams()) -> np.ndarray:
+    """q(x, t). A scalar x gives shape (n_t,); an array of distances gives (n_x, n_t)."""
+    # tau(x), one call for all distances
+    x = np.asarray(x_m, dtype=float)
+    tau_x = transmissivity(x, trans_params)
+    if x.ndim:
+        x = x[:, None]
+        tau_x = tau_x[:, None]
     # E(t)
     E_t = EPSILON * SIGMA * T_K**4  # W/m^2
     # F(x,t)
-    F_t = 0.25 * (D_m / x_m)**2
-    # tau(x)
-    tau_x = transmissivity(x_m, trans_params)  # scalar
+    F_t = 0.25 * (D_m / x)**2
     q_t = E_t * F_t * tau_x  # W/m^2
     return q_t
 
 
-def integrate_heat_radiation(q_t: np.ndarray, t_ms: np.ndarray) -> float:
+def integrate_heat_radiation(q_t: np.ndarray, t_ms: np.ndarray) -> float | np.ndarray:
+    """Integrate q over time along the last axis; a 2-D q_t gives one H per row."""
     t_s = t_ms / 1000.0
-    H = float(np.trapz(q_t, t_s))  # J/m^2
-    return H
+    H = _trapezoid(q_t, t_s, axis=-1)  # J/m^2
+    return float(H) if np.ndim(H) == 0 else H
+
+
+def compute_H_for_distances(xs: np.ndarray, t_ms: np.ndarray, T_K: np.ndarray, D_m: np.ndarray,
+                            trans_params: TransmissivityParams = TransmissivityParams()) -> np.ndarray:
+    """H(x) for many distances in one vectorized pass.
+
+    E(t) * D(t)^2 / 4 does not depend on x and is computed once; tau is evaluated
+    for all distances in one call, and the (n_x, n_t) flux grid is integrated row-wise.
+    """
+    xs = np.asarray(xs, dtype=float)
+    ED2_t = 0.25 * EPSILON * SIGMA * T_K**4 * D_m**2
+    tau_x = transmissivity(xs, trans_params)
+    q = (tau_x / xs**2)[:, None] * ED2_t[None, :]  # W/m^2
+    return integrate_heat_radiation(q, t_ms)
 
 
 def compute_H_vs_distance(x_min: float = 4.0, x_max: float = 6.0, n_x: int = 200,
@@ -72,13 +95,8 @@ def compute_H_vs_distance(x_min: float = 4.0, x_max: float = 6.0, n_x: int = 200
     T_K = compute_temperature_profile(t_ms)
     D_m = compute_diameter_profile(t_ms, material=material)
 
-    params = TransmissivityParams()
-
     xs = np.linspace(x_min, x_max, n_x)
-    Hs = np.zeros_like(xs)
-    for i, x in enumerate(xs):
-        q_t = compute_heat_flux_over_time(x, t_ms, T_K, D_m, params)
-        Hs[i] = integrate_heat_radiation(q_t, t_ms)
+    Hs = compute_H_for_distances(xs, t_ms, T_K, D_m, TransmissivityParams())
     return xs, Hs
 
 
@@ -121,12 +139,12 @@ def plot_heat_flux_vs_time(x_values: list[float] = None, material: str = '40%Al/
     # Colors for different distance curves
     colors = plt.cm.viridis(np.linspace(0, 1, len(x_values)))
     
+    # Heat flux over time for all distances at once, one row per distance
+    q = compute_heat_flux_over_time(np.asarray(x_values, dtype=float), t_ms, T_K, D_m, trans_params)
+    
     for i, x in enumerate(x_values):
-        # Compute heat flux over time for this distance
-        q_t = compute_heat_flux_over_time(x, t_ms, T_K, D_m, trans_params)
-        
         # Plot the curve
-        plt.plot(t_ms, q_t, color=colors[i], linewidth=2, 
+        plt.plot(t_ms, q[i], color=colors[i], linewidth=2, 
                 label=f'x = {x:.1f} m')
     
     plt.xlabel('Time (ms)')
@@ -144,8 +162,7 @@ def plot_heat_flux_vs_time(x_values: list[float] = None, material: str = '40%Al/
     
     # Print some statistics
     print(f'\nHeat flux statistics for material={material}:')
-    for x in x_values:
-        q_t = compute_heat_flux_over_time(x, t_ms, T_K, D_m, trans_params)
+    for x, q_t in zip(x_values, q):
         max_flux = np.max(q_t)
         max_time = t_ms[np.argmax(q_t)]
         total_energy = integrate_heat_radiation(q_t, t_ms)
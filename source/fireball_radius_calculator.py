@@ -12,10 +12,6 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib import rcParams
 
-# 设置中文字体
-rcParams['font.sans-serif'] = ['SimHei', 'Arial Unicode MS', 'DejaVu Sans']
-rcParams['axes.unicode_minus'] = False
-
 class FireballCalculator:
     """火球计算器类"""
     
@@ -161,6 +157,10 @@ class FireballCalculator:
         t_ms = np.linspace(0, t_max, n_points)  # 时间单位为ms (用于显示)
         t_s = t_ms / 1000  # 转换为秒 (用于计算)
         
+        # 设置中文字体（只在绘图时设置，导入本模块不修改全局样式）
+        rcParams['font.sans-serif'] = ['SimHei', 'Arial Unicode MS', 'DejaVu Sans']
+        rcParams['axes.unicode_minus'] = False
+        
         plt.figure(figsize=(12, 5))
         
         # 半径对比
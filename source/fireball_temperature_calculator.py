@@ -51,6 +51,19 @@ class DragDecay:
         return -(self.T0 - self.A) * self.k * np.exp(-self.k * (t - self.t0))  # °C/ms
 
 class FireballTemperatureCalculator:
+    # 按 (blend_width_ms, mode) 共享的实例，构造后只读，可跨线程使用
+    _shared: dict[tuple[float, str], FireballTemperatureCalculator] = {}
+
+    @classmethod
+    def shared(cls, blend_width_ms: float = 12.0, mode: Literal['blend','c1'] = 'blend') -> FireballTemperatureCalculator:
+        """返回共享实例，相同参数的拟合只做一次"""
+        key = (float(blend_width_ms), mode)
+        calc = cls._shared.get(key)
+        if calc is None:
+            calc = cls(blend_width_ms=blend_width_ms, mode=mode)
+            cls._shared[key] = calc
+        return calc
+
     def __init__(self, blend_width_ms: float = 12.0, mode: Literal['blend','c1'] = 'blend'):
         # 手工近似读取的“Modified temperature”数据点（°C）
         self.t_ms_all = np.array([0, 20, 35, 70, 105, 140], dtype=float)
@@ -83,21 +96,19 @@ class FireballTemperatureCalculator:
             A_min = 500.0
             A_max = min(T_decay) - 1.0
             A_grid = np.linspace(A_min, A_max, 401)
-            best = None
-            for A in A_grid:
-                B = self.T0 - A
-                if B <= 0:
-                    continue
-                k = -self.dT0 / B
-                if k <= 0:
-                    continue
-                T_pred = A + (self.T0 - A) * np.exp(-k * x)
-                sse = float(np.sum((T_decay - T_pred) ** 2))
-                if best is None or sse < best[0]:
-                    best = (sse, A, k)
-            if best is None:
+            B = self.T0 - A_grid
+            with np.errstate(divide='ignore'):
+                k_grid = -self.dT0 / B
+            valid = (B > 0) & (k_grid > 0)
+            if not valid.any():
                 raise RuntimeError('C1 模式下未能找到有效的 A')
-            _, A_opt, k_opt = best
+            A_grid = A_grid[valid]
+            k_grid = k_grid[valid]
+            # 所有候选 A 一次性计算残差，每行一个候选
+            T_pred = A_grid[:, None] + (self.T0 - A_grid[:, None]) * np.exp(-k_grid[:, None] * x)
+            sse = np.sum((T_decay - T_pred) ** 2, axis=-1)
+            best = np.argmin(sse)  # 并列时取首个，与逐个搜索一致
+            A_opt, k_opt = A_grid[best], k_grid[best]
         else:
             # blend 模式：C0 连续，(A,k) 联合搜索（°C）
             A_min = 500.0
@@ -106,14 +117,13 @@ class FireballTemperatureCalculator:
             k_max = 0.2
             A_grid = np.linspace(A_min, A_max, 401)
             k_grid = np.linspace(k_min, k_max, 400)
-            best = None
-            for A in A_grid:
-                for k in k_grid:
-                    T_pred = A + (self.T0 - A) * np.exp(-k * x)
-                    sse = float(np.sum((T_decay - T_pred) ** 2))
-                    if best is None or sse < best[0]:
-                        best = (sse, A, k)
-            _, A_opt, k_opt = best
+            # 整个 (A, k) 网格一次性广播计算残差，形状 (n_A, n_k)
+            A = A_grid[:, None, None]
+            k = k_grid[None, :, None]
+            T_pred = A + (self.T0 - A) * np.exp(-k * x)
+            sse = np.sum((T_decay - T_pred) ** 2, axis=-1)
+            i, j = np.unravel_index(np.argmin(sse), sse.shape)
+            A_opt, k_opt = A_grid[i], k_grid[j]
 
         self.decay_model = DragDecay(A=A_opt, k=k_opt, t0=self.t0, T0=self.T0)
 
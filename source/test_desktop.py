@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试桌面应用中不依赖界面交互的辅助逻辑
+"""
+
+import os
+import sys
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "desktop"))
+
+from PySide6.QtCore import QEventLoop, QRunnable, QThreadPool, QTimer
+from PySide6.QtWidgets import QApplication
+
+from extract_tab import _CSV_ROW_RE
+from export_tab import ExportTab
+
+
+def _app():
+    return QApplication.instance() or QApplication([])
+
+
+def _pump(ms):
+    """运行事件循环一段时间，处理排队的信号和定时器"""
+    loop = QEventLoop()
+    QTimer.singleShot(ms, loop.quit)
+    loop.exec()
+
+
+def test_csv_row_fallback_skips_malformed_rows():
+    """容错解析跳过格式错误的行，不与下一行拼接"""
+    assert _CSV_ROW_RE.findall("5,\n6,7\n8,9\n") == [("6", "7"), ("8", "9")]
+    # 多余列、首尾空白、CRLF 换行和科学计数法
+    text = "1, 2 ,x\r\n3,4\r\nbad\n 5 ,6\n7,8e1"
+    assert _CSV_ROW_RE.findall(text) == [("1", "2"), ("3", "4"), ("5", "6"), ("7", "8e1")]
+
+
+def test_export_log_from_worker_thread():
+    """工作线程中调用 log()，日志由 GUI 线程合并写入"""
+    _app()
+    tab = ExportTab()
+
+    class Writer(QRunnable):
+        def run(self):
+            for i in range(100):
+                tab.log(f"line {i}")
+
+    pool = QThreadPool()
+    pool.start(Writer())
+    pool.waitForDone()
+    _pump(200)
+    text = tab.log_text.toPlainText().splitlines()
+    assert text[-100:] == [f"line {i}" for i in range(100)]